@@ -0,0 +1,318 @@
+"""
+Benchmark di Window Launcher: caricamento, lista, ricerca, salvataggio e lancio.
+
+Non servono display né browser: la lista è un listbox simulato e l'apertura
+usa il backend ``fake``. I tempi vengono scritti in JSON per confrontare
+versioni diverse.
+
+Uso:
+    python benchmarks/bench_launcher.py                       # 10, 1000, 10000, 100000 elementi
+    python benchmarks/bench_launcher.py --sizes 10 1000 --repeat 5 -o results.json
+    python benchmarks/bench_launcher.py -o new.json --compare old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher import (FOLDER, URL, URL_BATCH, ConfigCache, ExistenceCache, FakeOpener,  # noqa: E402
+                      Item, ItemStore, LaunchRun, Preflight, SearchIndex, load_config, write_config)
+from launcher.loader import ConfigLoad  # noqa: E402
+from launcher.persist import ConfigSaver  # noqa: E402
+from launcher.search import refines  # noqa: E402
+from launcher.view import ListboxView  # noqa: E402
+
+DEFAULT_SIZES = (10, 1000, 10000, 100000)
+
+
+class FakeListbox:
+    """Listbox simulato: stesse chiamate di tk.Listbox usate da ListboxView, senza display."""
+
+    def __init__(self):
+        self.rows: list[str] = []
+        self.calls = 0
+        self._pending = []
+
+    def insert(self, index, *rows):
+        self.calls += 1
+        at = len(self.rows) if index == "end" else index
+        self.rows[at:at] = rows
+
+    def delete(self, first, last=None):
+        self.calls += 1
+        last = first if last is None else last
+        last = len(self.rows) - 1 if last == "end" else last
+        del self.rows[first:last + 1]
+
+    def yview(self):
+        return (0.0, 1.0)
+
+    def yview_moveto(self, fraction):
+        pass
+
+    def after(self, ms, fn, *args):
+        self._pending.append((fn, args))
+        return len(self._pending)
+
+    def after_cancel(self, after_id):
+        self._pending[after_id - 1] = (lambda: None, ())
+
+    def run_pending(self):
+        """Esegue i callback pianificati, come farebbe il ciclo degli eventi."""
+        while self._pending:
+            fn, args = self._pending.pop(0)
+            fn(*args)
+
+
+def make_items(n: int) -> ItemStore:
+    """Config sintetico: due terzi cartelle, un terzo URL, qualche campo extra."""
+    items = ItemStore()
+    for i in range(n):
+        if i % 3 == 2:
+            items.append(Item(f"sito-{i}.example.com", f"https://sito-{i}.example.com/pagina/{i}", URL))
+        else:
+            extra = {"note": f"progetto {i}"} if i % 10 == 0 else None
+            items.append(Item(f"Cartella {i}", f"C:\\Progetti\\cliente-{i % 97}\\lavoro-{i}", FOLDER, extra))
+    return items
+
+
+def measure(fn, repeat: int, setup=None) -> dict:
+    """Esegue ``fn`` ``repeat`` volte; restituisce tempi minimo e mediano (secondi)."""
+    times = []
+    extra = {}
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        t0 = time.perf_counter()
+        out = fn(arg) if setup else fn()
+        times.append(time.perf_counter() - t0)
+        if isinstance(out, dict):
+            extra = out
+    return {"min": min(times), "median": statistics.median(times), "repeat": repeat, **extra}
+
+
+# ── Benchmarks ───────────────────────────────────────────────────────────────
+
+def bench_load(path: str, cache: ConfigCache | None = None):
+    """Percorso di _load_config: lettura in streaming + blocchi aggiunti alla lista."""
+    items = ItemStore()
+    view = ListboxView(FakeListbox())
+    load = ConfigLoad(path, on_batch=lambda _load, batch, _progress: (items.extend(batch), view.extend(batch)),
+                      cache=cache)
+    load.start().wait()
+    if load.error:
+        raise load.error
+    return {"items": len(items), "cached": load.cached}
+
+
+def bench_load_json(path: str):
+    """Riferimento: json.load dell'intero file in un colpo solo."""
+    return {"items": len(load_config(path))}
+
+
+def bench_render(items: ItemStore):
+    """Percorso di _refresh_listbox: ricostruzione completa a blocchi."""
+    listbox = FakeListbox()
+    ListboxView(listbox).reset(items)
+    listbox.run_pending()
+    return {"listbox_calls": listbox.calls}
+
+
+def bench_render_edits(items: ItemStore):
+    """Modifiche incrementali: 100 aggiunte in coda e 100 rimozioni a metà lista."""
+    listbox = FakeListbox()
+    view = ListboxView(listbox)
+    view.reset(items)
+    listbox.run_pending()
+    listbox.calls = 0
+
+    def run():
+        for i in range(100):
+            view.append(Item(f"nuovo {i}", f"C:\\nuovo\\{i}"))
+        for _ in range(100):
+            view.remove(len(view) // 2)
+        return {"listbox_calls": listbox.calls}
+
+    return run
+
+
+def bench_search_build(items: ItemStore):
+    """Costruzione completa dell'indice di ricerca (in background nella GUI)."""
+    index = SearchIndex()
+    index.build(items)
+    index.wait()
+    return {"indexed": len(index)}
+
+
+def bench_search(index: SearchIndex, items: ItemStore):
+    """Percorso di _apply_filter mentre si scrive una ricerca, un tasto alla volta."""
+    shown = None
+    previous = ""
+    slowest = 0.0
+    for query in ("c", "cl", "cli", "clie", "cliente", "cliente-4", "cliente-42", "cliente-42 lav"):
+        t0 = time.perf_counter()
+        within = shown if shown is not None and refines(query, previous) else None
+        shown = index.search(query, items, within=within)
+        slowest = max(slowest, time.perf_counter() - t0)
+        previous = query
+    broad = time.perf_counter()
+    index.search("progetti", items)     # corrisponde a tutte le cartelle
+    return {"matches": len(shown), "slowest_key": slowest, "broad": time.perf_counter() - broad}
+
+
+def bench_save(path: str, items: ItemStore):
+    """Percorso di _write_config: scrittura atomica e compatta."""
+    write_config(path, items, meta={"settings": {"opener": "fake"}})
+    return {"bytes": os.path.getsize(path)}
+
+
+def bench_save_sqlite_edit(path: str, items: ItemStore):
+    """Config SQLite: un elemento aggiunto e uno tolto, scrivendo solo le righe cambiate."""
+    meta = {"settings": {"opener": "fake"}}
+    write_config(path, items, meta=meta)
+    edited = list(items) + [Item("nuovo", "C:\\nuovo")]
+
+    def run():
+        write_config(path, edited, meta=meta)
+        write_config(path, items, meta=meta)
+        return {"bytes": os.path.getsize(path)}
+
+    return run
+
+
+def bench_save_burst(path: str, items: ItemStore):
+    """50 salvataggi ravvicinati accorpati dal salvataggio in background."""
+    saver = ConfigSaver(delay=0.05)
+    for _ in range(50):
+        saver.save(path, items)
+    saver.close()
+    stats = saver.stats()
+    return {"writes": stats["writes"], "coalesced": stats["coalesced"]}
+
+
+def bench_launch(items: ItemStore):
+    """Percorso di _launch_all: pre-flight simulato + lancio con il backend fake."""
+    cache = ExistenceCache()
+    Preflight(cache, isdir=lambda path: True).check(i.path for i in items if i.type == FOLDER)
+    opener = FakeOpener()
+    run = LaunchRun(items, opener=opener, cache=cache, url_batch=URL_BATCH).start()
+    run.wait()
+    return {"opened": len(opener.opened), "invocations": opener.invocations,
+            "failures": len(run.failures)}
+
+
+def bench_memory(items: ItemStore):
+    """Memoria occupata dagli elementi: ItemStore contro la vecchia lista di dict."""
+    dicts = items.to_dicts()
+    text = json.dumps({"items": dicts})
+    del dicts
+    tracemalloc.start()
+    as_dicts = json.loads(text)["items"]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    del as_dicts
+    tracemalloc.stop()
+    tracemalloc.start()
+    store = ItemStore.from_dicts(json.loads(text)["items"])
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    del store
+    tracemalloc.stop()
+    return {"dict_bytes": dict_bytes, "store_bytes": store_bytes}
+
+
+def run_size(n: int, repeat: int, folder: str) -> list[dict]:
+    items = make_items(n)
+    path = os.path.join(folder, f"config-{n}.json")
+    write_config(path, items)
+    cache = ConfigCache()
+    cache.put(path, items)
+    index = SearchIndex()
+    index.build(items)
+    index.wait()
+    benches = [
+        ("load", lambda: bench_load(path)),
+        ("load_cached", lambda: bench_load(path, cache)),
+        ("load_json", lambda: bench_load_json(path)),
+        ("render", lambda: bench_render(items)),
+        ("render_edits", None),
+        ("search_build", lambda: bench_search_build(items)),
+        ("search", lambda: bench_search(index, items)),
+        ("save", lambda: bench_save(os.path.join(folder, "save.json"), items)),
+        ("save_burst", lambda: bench_save_burst(os.path.join(folder, "burst.json"), items)),
+        ("save_sqlite_edit", None),
+        ("launch", lambda: bench_launch(items)),
+    ]
+    results = []
+    for name, fn in benches:
+        if name == "render_edits":
+            result = measure(lambda run: run(), repeat, setup=lambda: bench_render_edits(items))
+        elif name == "save_sqlite_edit":
+            sqlite_path = os.path.join(folder, f"config-{n}.sqlite")
+            result = measure(lambda run: run(), repeat,
+                             setup=lambda: bench_save_sqlite_edit(sqlite_path, items))
+        else:
+            result = measure(fn, repeat)
+        results.append({"bench": name, "size": n, **result})
+    mem = bench_memory(items)
+    results.append({"bench": "memory", "size": n, **mem})
+    return results
+
+
+def compare(results: list[dict], baseline_path: str):
+    """Stampa il rapporto con i tempi mediani di un file di risultati precedente."""
+    with open(baseline_path, "r", encoding="utf-8") as fp:
+        baseline = json.load(fp)
+    old = {(r["bench"], r["size"]): r for r in baseline["results"]}
+    print(f"\nConfronto con {baseline_path} (mediana nuova / vecchia):")
+    for r in results:
+        before = old.get((r["bench"], r["size"]))
+        if before and "median" in r and before.get("median"):
+            ratio = r["median"] / before["median"]
+            flag = "  ⚠ più lento" if ratio > 1.10 else ""
+            print(f"  {r['bench']:<13} {r['size']:>7}  x{ratio:.2f}{flag}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark di Window Launcher (senza display)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="numero di elementi dei config sintetici")
+    parser.add_argument("--repeat", type=int, default=3, help="ripetizioni per misura")
+    parser.add_argument("-o", "--output", help="file JSON dei risultati (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="risultati precedenti da confrontare")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="launcher-bench-") as folder:
+        for n in args.sizes:
+            print(f"… {n} elementi", file=sys.stderr)
+            results.extend(run_size(n, args.repeat, folder))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Nucleo di Window Launcher, utilizzabile senza interfaccia grafica."""
+
+from .browser import URL_BATCH, open_urls
+from .cache import ConfigCache
+from .config import (APP_DIR, CONFIG_FILE, SQLITE_SUFFIXES, convert_config, get_setting, load_config,
+                     normalize_items, set_setting, write_config)
+from .engine import (LAUNCH_DELAY, LAUNCH_TYPE_LIMITS, LAUNCH_WORKERS, LaunchResult, LaunchRun,
+                     launch_settings, launch_target)
+from .instance import InstanceServer, forward_request
+from .items import FOLDER, URL, Item, ItemStore
+from .openers import OPENERS, FakeOpener, Opener, close_openers, get_opener, resolve_opener
+from .preflight import ExistenceCache, Preflight
+from .search import SearchIndex
+
+__all__ = [
+    "APP_DIR",
+    "CONFIG_FILE",
+    "ConfigCache",
+    "ExistenceCache",
+    "FakeOpener",
+    "FOLDER",
+    "InstanceServer",
+    "Item",
+    "ItemStore",
+    "LAUNCH_DELAY",
+    "LAUNCH_TYPE_LIMITS",
+    "LAUNCH_WORKERS",
+    "LaunchResult",
+    "LaunchRun",
+    "OPENERS",
+    "Opener",
+    "Preflight",
+    "SQLITE_SUFFIXES",
+    "SearchIndex",
+    "URL",
+    "URL_BATCH",
+    "close_openers",
+    "convert_config",
+    "forward_request",
+    "get_opener",
+    "get_setting",
+    "launch_settings",
+    "launch_target",
+    "load_config",
+    "normalize_items",
+    "open_urls",
+    "resolve_opener",
+    "set_setting",
+    "write_config",
+]
@@ -0,0 +1,117 @@
+"""
+Apertura di più URL con una sola invocazione del browser.
+
+``webbrowser.open`` avvia un processo di controllo per ogni URL; la maggior
+parte dei browser accetta invece più URL sulla stessa riga di comando e li apre
+come schede di un'unica finestra. Se il browser predefinito non è tra quelli
+riconosciuti si torna all'apertura URL per URL.
+"""
+
+import os
+import subprocess
+import sys
+
+URL_BATCH = 20          # URL massimi passati al browser in una sola invocazione
+
+# Eseguibili che accettano più URL come argomenti posizionali
+_MULTI_URL_BROWSERS = {
+    "chrome", "chromium", "chromium-browser", "google-chrome", "google-chrome-stable",
+    "msedge", "microsoft-edge", "brave", "brave-browser", "vivaldi", "opera",
+    "firefox", "firefox-esr",
+}
+
+_UNSET = object()
+_command = _UNSET
+
+
+def _exe_name(path: str) -> str:
+    name = os.path.basename(path).lower()
+    return name[:-4] if name.endswith(".exe") else name
+
+
+def _windows_command() -> list[str] | None:
+    """Eseguibile del browser predefinito letto dal registro di Windows."""
+    import winreg
+
+    try:
+        key = r"Software\Microsoft\Windows\Shell\Associations\UrlAssociations\https\UserChoice"
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key) as k:
+            prog_id = winreg.QueryValueEx(k, "ProgId")[0]
+        with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, prog_id + r"\shell\open\command") as k:
+            command = winreg.QueryValueEx(k, "")[0]
+    except OSError:
+        return None
+    # Es. "C:\...\chrome.exe" --single-argument %1: serve solo l'eseguibile
+    command = command.strip()
+    if command.startswith('"'):
+        exe = command[1:command.find('"', 1)]
+    else:
+        exe = command.split(" ", 1)[0]
+    return [exe] if _exe_name(exe) in _MULTI_URL_BROWSERS else None
+
+
+def _unix_command() -> list[str] | None:
+    import webbrowser   # caricato solo al primo lancio: non serve per mostrare la finestra
+
+    try:
+        browser = webbrowser.get()
+    except webbrowser.Error:
+        return None
+    name = getattr(browser, "name", "")
+    if isinstance(browser, webbrowser.UnixBrowser) and _exe_name(name) in _MULTI_URL_BROWSERS:
+        return [name]
+    return None
+
+
+def batch_command() -> list[str] | None:
+    """
+    Riga di comando (senza URL) che apre più URL in un colpo solo, o None se
+    il browser predefinito non lo supporta. Calcolata una volta sola.
+    """
+    global _command
+    if _command is _UNSET:
+        if sys.platform == "win32":
+            _command = _windows_command()
+        elif sys.platform == "darwin":
+            _command = ["open"]
+        else:
+            _command = _unix_command()
+    return _command
+
+
+def open_urls(urls: list[str], batch_size: int = URL_BATCH, command=_UNSET):
+    """
+    Apre gli URL a gruppi di ``batch_size`` per invocazione del browser.
+
+    Con ``batch_size`` 1, o se il browser non supporta più URL, ogni URL viene
+    aperto con ``webbrowser.open`` come in precedenza. Se l'avvio del browser
+    fallisce, il gruppo viene riaperto URL per URL.
+    """
+    if command is _UNSET:
+        command = batch_command()
+    if command is None or batch_size <= 1:
+        for url in urls:
+            _open_one(url)
+        return
+    for start in range(0, len(urls), batch_size):
+        chunk = urls[start:start + batch_size]
+        try:
+            _spawn(command + chunk)
+        except OSError:
+            for url in chunk:
+                _open_one(url)
+
+
+def _open_one(url: str):
+    import webbrowser
+
+    webbrowser.open(url)
+
+
+def _spawn(args: list[str]):
+    kwargs = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(args, **kwargs)
@@ -0,0 +1,150 @@
+"""
+Cache in memoria dei config già letti, per passare da un file all'altro senza rileggerli.
+
+Le voci sono indicizzate per percorso normalizzato e restano valide finché
+mtime e dimensione del file non cambiano. Le meno usate di recente vengono
+scartate quando si supera il budget di memoria o il numero massimo di voci.
+"""
+
+import collections
+import copy
+import os
+import sys
+import threading
+
+from .items import FOLDER, Item
+
+CACHE_BUDGET = 64 * 1024 * 1024     # byte stimati massimi occupati dalla cache
+CACHE_ENTRIES = 8                   # config tenuti in memoria al massimo
+
+_ITEM_SIZE = sys.getsizeof(Item("", "", FOLDER))
+
+
+def _key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int]:
+    return stat.st_mtime_ns, stat.st_size
+
+
+def estimate_size(items, meta: dict | None = None) -> int:
+    """Stima (per difetto) dei byte occupati da una lista di elementi."""
+    size = sys.getsizeof(items) + (sys.getsizeof(meta) if meta else 0)
+    for item in items:
+        size += _ITEM_SIZE + sys.getsizeof(item.name) + sys.getsizeof(item.path)
+        if item.extra:
+            size += sys.getsizeof(item.extra)
+    return size
+
+
+class _Entry:
+    __slots__ = ("items", "meta", "signature", "size")
+
+    def __init__(self, items: tuple, meta: dict, signature: tuple[int, int], size: int):
+        self.items = items
+        self.meta = meta
+        self.signature = signature
+        self.size = size
+
+
+class ConfigCache:
+    """
+    Cache LRU thread-safe dei config letti.
+
+    ``get()`` restituisce ``(items, meta)`` solo se il file su disco ha ancora
+    mtime e dimensione registrati con ``put()``; altrimenti scarta la voce. Gli
+    elementi sono immutabili e possono essere condivisi, ``meta`` viene copiato
+    perché la GUI lo modifica sul posto.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_BUDGET, max_entries: int = CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Statistiche
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0      # voci scartate perché il file è cambiato
+        self.evictions = 0          # voci scartate per rispettare il budget
+        self.skipped = 0            # config troppo grandi per entrare nella cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str, stat: os.stat_result | None = None):
+        """``(items, meta)`` del config se in cache e ancora valido, altrimenti None."""
+        key = _key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+        try:
+            signature = _signature(stat or os.stat(path))
+        except OSError:
+            signature = None
+        with self._lock:
+            if self._entries.get(key) is not entry:
+                self.misses += 1
+                return None
+            if signature != entry.signature:
+                self._drop(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.items, copy.deepcopy(entry.meta)
+
+    def put(self, path: str, items, meta: dict | None = None, stat: os.stat_result | None = None):
+        """
+        Registra il contenuto di ``path``. ``stat`` deve essere quello del file
+        letto o scritto (preso prima della lettura); se manca viene letto ora.
+        """
+        try:
+            signature = _signature(stat or os.stat(path))
+        except OSError:
+            return
+        items = tuple(items)
+        meta = copy.deepcopy(meta) if meta else {}
+        size = estimate_size(items, meta)
+        key = _key(path)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                self.skipped += 1
+                return
+            self._entries[key] = _Entry(items, meta, signature, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, path: str | None = None):
+        """Scarta la voce di ``path``, oppure tutte se None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif _key(path) in self._entries:
+                self._drop(_key(path))
+
+    def _drop(self, key: str):
+        self._bytes -= self._entries.pop(key).size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "skipped": self.skipped,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,251 @@
+"""
+Lettura e scrittura dei file di configurazione JSON.
+
+Formato: ``{"items": [{"name": ..., "path": ..., "type": "folder" | "url"}], "settings": {...}}``;
+i file più vecchi usano la chiave ``folders`` al posto di ``items``. Le chiavi di
+primo livello diverse da ``items`` vengono conservate in ``ItemStore.meta``.
+I file ``.sqlite`` / ``.db`` vengono letti e scritti da ``sqlstore``.
+"""
+
+import json
+import os
+import stat as stat_module
+import sys
+import tempfile
+
+from .items import Item, ItemStore
+
+# ── Paths ────────────────────────────────────────────────────────────────────
+APP_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
+CONFIG_FILE = os.path.join(APP_DIR, "config.json")
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")    # estensioni dei config in formato SQLite
+
+# umask del processo, letta una volta sola (os.umask la imposta mentre la legge)
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def normalize_items(data: dict) -> ItemStore:
+    """Estrae gli elementi da un config già decodificato; solleva ValueError se non è un config."""
+    if not isinstance(data, dict):
+        raise ValueError("JSON non valido: il config deve essere un oggetto")
+    # Retrocompatibilità: supporta sia "items" che il vecchio "folders"
+    raw = data.get("items", data.get("folders", []))
+    if not isinstance(raw, list):
+        raise ValueError("JSON non valido: la lista degli elementi deve essere un array")
+    # Gli elementi senza 'type' sono cartelle
+    store = ItemStore.from_dicts(raw)
+    store.meta = {k: v for k, v in data.items()
+                  if k != "items" and not (k == "folders" and "items" not in data)}
+    return store
+
+
+def get_setting(meta: dict, key: str, default=None):
+    """Valore di ``settings[key]`` nelle chiavi di primo livello di un config."""
+    settings = meta.get("settings")
+    return settings.get(key, default) if isinstance(settings, dict) else default
+
+
+def set_setting(meta: dict, key: str, value):
+    settings = meta.get("settings")
+    if not isinstance(settings, dict):
+        settings = meta["settings"] = {}
+    if value is None:
+        settings.pop(key, None)
+    else:
+        settings[key] = value
+
+
+_WS = " \t\n\r"
+_NUMBER_TAIL = 3        # un numero spezzato può lasciare indietro fino a 2 caratteri ("e-")
+_decoder = json.JSONDecoder()
+
+
+class _Stream:
+    """Buffer di testo letto a blocchi, con decodifica di un valore JSON alla volta."""
+
+    def __init__(self, fp, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0       # caratteri già scartati dal buffer
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Scarta la parte già letta per non far crescere il buffer
+        self.consumed += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Primo carattere non vuoto (stringa vuota a fine file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"JSON non valido: atteso {chars!r} alla posizione {self.consumed + self.pos}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Valore spezzato a fine buffer: legge un altro blocco e riprova
+                if self._fill():
+                    continue
+                raise
+            if len(self.buf) - end < _NUMBER_TAIL and not self.eof and not isinstance(obj, (dict, list, str)):
+                # Un numero potrebbe continuare nel blocco successivo: "1." o "1.5e-" a fine
+                # buffer vengono decodificati come 1 e 1.5 lasciando indietro "." o "e-"
+                if self._fill():
+                    continue
+            self.pos = end
+            return obj
+
+    def array(self):
+        """Itera sugli elementi di un array JSON, uno alla volta."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_config_items(fp, chunk_size: int = 1 << 16, meta: dict | None = None):
+    """
+    Legge gli elementi di un config in streaming, senza caricare l'intero file.
+
+    Gli elementi di ``items`` vengono restituiti man mano che vengono decodificati;
+    quelli del vecchio ``folders`` solo a fine file, se ``items`` non è presente.
+    Le altre chiavi di primo livello finiscono in ``meta``, se indicato.
+    """
+    if meta is None:
+        meta = {}
+    stream = _Stream(fp, chunk_size)
+    stream.expect("{")
+    legacy = None
+    found = False
+    if stream.peek() == "}":
+        stream.pos += 1
+    else:
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError("JSON non valido: chiave non testuale")
+            stream.expect(":")
+            if key == "items" and not found and stream.peek() == "[":
+                found = True
+                for item in stream.array():
+                    yield Item.from_dict(item)
+            elif key == "folders" and not found and stream.peek() == "[":
+                legacy = list(stream.array())
+            else:
+                meta[key] = stream.value()
+            if stream.expect(",}") == "}":
+                break
+    if stream.peek():
+        raise ValueError("JSON non valido: dati dopo la fine del documento")
+    if found and legacy is not None:
+        meta["folders"] = legacy
+    elif legacy:
+        for item in legacy:
+            yield Item.from_dict(item)
+
+
+def is_sqlite_config(path: str) -> bool:
+    """Il percorso indica un config SQLite (in base all'estensione)."""
+    return path.lower().endswith(SQLITE_SUFFIXES)
+
+
+def load_config(path: str) -> ItemStore:
+    """Legge gli elementi dal file indicato; solleva OSError/ValueError in caso di errore."""
+    if is_sqlite_config(path):
+        from .sqlstore import load_sql_config
+
+        return load_sql_config(path)
+    with open(path, "r", encoding="utf-8") as fp:
+        data = json.load(fp)
+    return normalize_items(data)
+
+
+def _file_mode(path: str) -> int:
+    """Permessi del config esistente, altrimenti quelli predefiniti per un file nuovo."""
+    try:
+        return stat_module.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def write_config(path: str, items, fsync: bool = False, meta: dict | None = None):
+    """
+    Scrive gli elementi nel file indicato in formato compatto.
+
+    Il contenuto viene scritto in un file temporaneo nella stessa cartella e poi
+    rinominato sopra quello esistente: un crash a metà scrittura non lascia mai
+    un config troncato. Con ``fsync`` i dati vengono forzati su disco prima della rinomina.
+    ``meta`` contiene le altre chiavi di primo livello (es. ``settings``).
+    Restituisce lo ``os.stat_result`` del file scritto.
+
+    Per un config SQLite vengono scritte solo le righe cambiate (``write_sql_config``).
+    """
+    if is_sqlite_config(path):
+        from .sqlstore import write_sql_config
+
+        return write_sql_config(path, items, fsync=fsync, meta=meta)
+    data = {"items": [item.to_dict() for item in items]}
+    if meta:
+        data.update((k, v) for k, v in meta.items() if k != "items")
+    # Un config che è un link simbolico resta tale: si sostituisce il file a cui punta
+    path = os.path.realpath(path)
+    mode = _file_mode(path)
+    fd, tmp = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, ensure_ascii=False, separators=(",", ":"))
+            fp.flush()
+            if fsync:
+                os.fsync(fp.fileno())
+            # La rinomina conserva mtime e dimensione: è lo stat del config finale
+            stat = os.fstat(fp.fileno())
+        # mkstemp crea il file con permessi 0600: si tengono quelli del config
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return stat
+
+
+def convert_config(src: str, dst: str) -> int:
+    """
+    Copia un config in un altro file, convertendo tra JSON e SQLite in base
+    alle estensioni; elementi e chiavi di primo livello restano invariati.
+    Restituisce il numero di elementi copiati.
+    """
+    items = load_config(src)
+    write_config(dst, items, meta=items.meta)
+    return len(items)
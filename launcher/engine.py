@@ -0,0 +1,337 @@
+"""
+Motore di lancio: apre cartelle e URL su un pool limitato di thread.
+Non dipende da tkinter, così può essere usato sia dalla GUI sia dalla riga di comando.
+
+Il lancio segue la priorità degli elementi (campo ``priority`` del config, più
+alta prima) e rispetta un massimo di aperture contemporanee, un limite per tipo
+e un intervallo minimo tra due avvii, configurabili in ``settings``.
+"""
+
+import collections
+import functools
+import os
+import threading
+import time
+
+from .browser import URL_BATCH, batch_command
+from .config import get_setting
+from .items import FOLDER, URL, Item
+from .openers import Opener, get_opener
+from .preflight import MISSING, OK, SLOW, ExistenceCache
+from .trace import tracer
+
+LAUNCH_WORKERS = 4                  # aperture contemporanee al massimo (thread usati)
+LAUNCH_DELAY = 0.0                  # secondi minimi tra l'avvio di due aperture
+LAUNCH_TYPE_LIMITS = {FOLDER: 2}    # aperture contemporanee per tipo (le finestre di Esplora file pesano)
+
+
+def launch_target(item: Item, cache: ExistenceCache | None = None, opener: Opener | None = None):
+    """
+    Apre un singolo elemento in base al tipo; solleva un'eccezione in caso di errore.
+
+    Con ``cache`` l'esistenza delle cartelle viene letta dagli esiti del pre-flight
+    ancora validi invece di rifare ``stat``; i percorsi lenti non vengono aperti.
+    ``opener`` è il backend di apertura (predefinito per la piattaforma se None).
+    """
+    opener = opener or get_opener()
+    path = item.path
+    if item.type == URL:
+        opener.open_urls([path])
+    else:  # folder
+        status = cache.get(path) if cache is not None else None
+        if status is None:
+            status = OK if os.path.isdir(path) else MISSING
+        if status == MISSING:
+            raise FileNotFoundError(f"La cartella non esiste: {path}")
+        if status == SLOW:
+            raise TimeoutError(f"La cartella non risponde: {path}")
+        opener.open_folder(path)
+
+
+def launch_urls(items: list[Item], opener: Opener | None = None):
+    """Apre più URL con una sola invocazione del browser (se supportato)."""
+    (opener or get_opener()).open_urls([item.path for item in items])
+
+
+def item_priority(item: Item) -> float:
+    """Campo ``priority`` dell'elemento (0 se assente o non numerico)."""
+    value = item.extra.get("priority") if item.extra else None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return 0
+
+
+def launch_order(items: list[Item]) -> list[int]:
+    """Indici in ordine di lancio: priorità decrescente, a parità l'ordine della lista."""
+    order = list(range(len(items)))
+    if any(item.extra for item in items):
+        order.sort(key=lambda index: -item_priority(items[index]))
+    return order
+
+
+def launch_settings(meta: dict) -> dict:
+    """
+    Parametri di ``LaunchRun`` letti da ``settings`` del config:
+    ``launch_workers``, ``launch_delay`` (secondi) e ``launch_limits``
+    (es. ``{"folder": 2, "url": 4}``). I valori non validi vengono ignorati.
+    """
+    options = {}
+    workers = get_setting(meta, "launch_workers")
+    if isinstance(workers, int) and not isinstance(workers, bool) and workers > 0:
+        options["workers"] = workers
+    delay = get_setting(meta, "launch_delay")
+    if isinstance(delay, (int, float)) and not isinstance(delay, bool) and delay >= 0:
+        options["delay"] = float(delay)
+    limits = get_setting(meta, "launch_limits")
+    if isinstance(limits, dict):
+        options["type_limits"] = {k: v for k, v in limits.items()
+                                  if isinstance(v, int) and not isinstance(v, bool) and v > 0}
+    return options
+
+
+def plan_units(items: list[Item], url_batch: int, order=None) -> list[list[int]]:
+    """
+    Raggruppa gli indici degli elementi in unità di lancio: ogni cartella è
+    un'unità a sé, gli URL vengono riuniti in gruppi di ``url_batch``. Ogni
+    gruppo prende il posto del suo primo URL, così l'ordine resta quello della
+    lista (o di ``order``, la sequenza degli indici da lanciare).
+    """
+    units: list[list[int]] = []
+    group: list[int] | None = None
+    for index in range(len(items)) if order is None else order:
+        item = items[index]
+        if item.type != URL or url_batch <= 1:
+            units.append([index])
+            continue
+        if group is None or len(group) >= url_batch:
+            group = []
+            units.append(group)
+        group.append(index)
+    return units
+
+
+class LaunchResult:
+    """Esito del lancio di un singolo elemento."""
+
+    __slots__ = ("index", "item", "error", "start", "elapsed")
+
+    def __init__(self, index: int, item: Item, error, elapsed: float, start: float = 0.0):
+        self.index = index
+        self.item = item
+        self.error = error
+        self.start = start          # time.perf_counter() all'inizio dell'apertura
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def finish(self) -> float:
+        return self.start + self.elapsed
+
+
+class LaunchRun:
+    """
+    Lancio di una lista di elementi su un pool limitato di thread.
+
+    Non tocca mai tkinter: ogni esito viene passato a ``on_result`` e la fine
+    del lancio a ``on_finish``, entrambi chiamati dai thread worker. La GUI li
+    inoltra a una coda che svuota periodicamente con ``after()``.
+
+    Al massimo ``workers`` aperture sono in corso insieme, e per ogni tipo non
+    più di ``type_limits[tipo]``; tra due avvii passano almeno ``delay`` secondi.
+    Gli elementi partono in ordine di priorità (``launch_order``).
+    """
+
+    def __init__(self, items, launch_fn=None, workers: int = LAUNCH_WORKERS,
+                 on_result=None, on_finish=None, url_batch: int | None = None,
+                 launch_batch_fn=None, opener: Opener | None = None,
+                 cache: ExistenceCache | None = None, delay: float = LAUNCH_DELAY,
+                 type_limits: dict[str, int] | None = None):
+        self.items = list(items)
+        self.results: list[LaunchResult] = []
+        self.elapsed = 0.0
+        # launch_fn / launch_batch_fn sostituiscono del tutto l'apertura (test, benchmark)
+        self._launch_fn = launch_fn or functools.partial(launch_target, cache=cache, opener=opener)
+        self._launch_batch_fn = launch_batch_fn or functools.partial(launch_urls, opener=opener)
+        if url_batch is None and not any(item.type == URL for item in self.items):
+            url_batch = 1   # nessun URL: non serve cercare il browser
+        # Con url_batch None il browser viene cercato (anche avviando processi) in start(), fuori dalla UI
+        self._url_batch = url_batch
+        self._max_workers = workers
+        self._units: list[list[int]] = []
+        self._workers = 1
+        self.delay = max(0.0, delay)
+        self.type_limits = dict(LAUNCH_TYPE_LIMITS if type_limits is None else type_limits)
+        self._on_result = on_result
+        self._on_finish = on_finish
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        # Unità in attesa, una coda per tipo; il numero d'ordine decide quale parte prima
+        self._queues: dict[str, collections.deque] = {}
+        self._in_flight: dict[str, int] = {}
+        if url_batch is not None:
+            self._plan(url_batch)
+        self._next_start = 0.0
+        self._active = 0
+        self._started = 0.0
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def failures(self) -> list[LaunchResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def started(self) -> float:
+        """``time.perf_counter()`` all'avvio del lancio."""
+        return self._started
+
+    def timeline(self) -> list[LaunchResult]:
+        """Esiti in ordine di avvio (``start``/``finish`` di ogni elemento)."""
+        with self._lock:
+            results = list(self.results)
+        return sorted(results, key=lambda r: (r.start, r.index))
+
+    def slowest(self, n: int = 10) -> list[LaunchResult]:
+        """Gli ``n`` elementi che hanno impiegato più tempo ad aprirsi."""
+        with self._lock:
+            results = list(self.results)
+        return sorted(results, key=lambda r: r.elapsed, reverse=True)[:n]
+
+    def start(self):
+        self._started = time.perf_counter()
+        if not self.items:
+            self._finish()
+        elif self._url_batch is None:
+            threading.Thread(target=self._plan_and_start, name="launch-plan", daemon=True).start()
+        else:
+            self._start_workers()
+        return self
+
+    def _plan(self, url_batch: int):
+        self._units = plan_units(self.items, url_batch, launch_order(self.items))
+        self._workers = max(1, min(self._max_workers, len(self._units) or 1))
+        for seq, unit in enumerate(self._units):
+            kind = self.items[unit[0]].type
+            self._queues.setdefault(kind, collections.deque()).append((seq, unit))
+        self._in_flight = dict.fromkeys(self._queues, 0)
+
+    def _plan_and_start(self):
+        try:
+            # Senza un browser che accetti più URL i gruppi toglierebbero solo parallelismo
+            url_batch = URL_BATCH if batch_command() else 1
+        except Exception:
+            url_batch = 1
+        with self._lock:
+            self._plan(url_batch)
+        self._start_workers()
+
+    def _start_workers(self):
+        self._active = self._workers
+        for _ in range(self._workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def cancel(self):
+        """Interrompe il lancio: gli elementi già in apertura vengono completati."""
+        self._cancel.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait(self, timeout=None) -> bool:
+        return self._done.wait(timeout)
+
+    def _worker(self):
+        try:
+            self._work()
+        finally:
+            # Anche se un callback solleva un'eccezione il lancio deve potersi concludere
+            with self._lock:
+                self._active -= 1
+                last = self._active == 0
+            if last:
+                self._finish()
+
+    def _take(self):
+        """Prossima unità (con il suo tipo) che rispetta i limiti; chiamato col lock."""
+        best = None
+        for kind, queue in self._queues.items():
+            if queue and self._in_flight[kind] < max(1, self.type_limits.get(kind, self._workers)):
+                if best is None or queue[0][0] < self._queues[best][0][0]:
+                    best = kind
+        if best is None:
+            return None, None
+        return self._queues[best].popleft()[1], best
+
+    def _next_unit(self):
+        """Attende un'unità lanciabile e il suo turno di avvio; None a fine lancio o annullato."""
+        with self._cond:
+            while True:
+                if self._cancel.is_set() or not any(self._queues.values()):
+                    return None, None
+                unit, kind = self._take()
+                if unit is not None:
+                    break
+                self._cond.wait()   # tutti i tipi con unità in attesa sono al limite
+            self._in_flight[kind] += 1
+            now = time.perf_counter()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.delay
+        if start_at > now and self._cancel.wait(start_at - now):
+            self._release(kind)
+            return None, None
+        return unit, kind
+
+    def _release(self, kind: str):
+        with self._cond:
+            self._in_flight[kind] -= 1
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            unit, kind = self._next_unit()
+            if unit is None:
+                break
+            items = [self.items[index] for index in unit]
+            t0 = time.perf_counter()
+            try:
+                if len(items) == 1:
+                    self._launch_fn(items[0])
+                else:
+                    self._launch_batch_fn(items)
+                error = None
+            except Exception as e:
+                error = e
+            elapsed = time.perf_counter() - t0
+            self._release(kind)
+            # Gli elementi di un gruppo condividono esito e durata
+            results = [LaunchResult(index, item, error, elapsed, t0) for index, item in zip(unit, items)]
+            for result in results:
+                tracer.add("launch.item", t0, elapsed, cat="launch", item=result.item.name,
+                           type=result.item.type, batch=len(results), ok=result.ok)
+            with self._lock:
+                self.results.extend(results)
+            if self._on_result:
+                for result in results:
+                    self._on_result(result)
+
+    def _finish(self):
+        self.elapsed = time.perf_counter() - self._started
+        tracer.add("launch.run", self._started, self.elapsed, cat="launch", items=self.total,
+                   results=len(self.results), cancelled=self.cancelled)
+        self._done.set()
+        if self._on_finish:
+            self._on_finish(self)
@@ -0,0 +1,1243 @@
+"""
+Window Launcher — finestra principale (GUI tkinter dark mode).
+Caricamento, salvataggio e lancio sono delegati al nucleo in ``launcher``.
+"""
+
+import tkinter as tk
+import importlib
+import os
+import queue
+import sys
+import threading
+import time
+
+from .cache import ConfigCache
+from .config import APP_DIR, CONFIG_FILE, SQLITE_SUFFIXES, set_setting
+from .engine import LaunchResult, LaunchRun, launch_settings
+from .instance import InstanceServer
+from .items import FOLDER, URL, Item, ItemStore, changed_range, position
+from .loader import ConfigLoad
+from .openers import Opener, close_openers, default_opener_name, resolve_opener, selectable_openers
+from .persist import ConfigSaver
+from .preflight import MISSING, SLOW, ExistenceCache, Preflight
+from .search import SearchIndex, refines
+from .trace import tracer
+from .view import ListboxView
+from .watch import FileWatcher, file_signature
+
+
+class _LazyModule:
+    """Modulo importato al primo accesso a un suo attributo (non serve per il primo frame)."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            with tracer.span("startup.lazy_import", cat="import", module=self._name):
+                self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+filedialog = _LazyModule("tkinter.filedialog")
+messagebox = _LazyModule("tkinter.messagebox")
+simpledialog = _LazyModule("tkinter.simpledialog")
+
+# ── Colors (dark mode palette) ───────────────────────────────────────────────
+BG_DARK      = "#1a1a2e"
+BG_CARD      = "#16213e"
+BG_INPUT     = "#0f3460"
+FG_TEXT       = "#e0e0e0"
+FG_SECONDARY  = "#a0a0b0"
+ACCENT        = "#e94560"
+ACCENT_HOVER  = "#ff6b81"
+SUCCESS       = "#00d2d3"
+SUCCESS_HOVER = "#48dbfb"
+BORDER        = "#2a2a4a"
+HIGHLIGHT_BG  = "#0f3460"
+
+# ── Fonts ────────────────────────────────────────────────────────────────────
+FONT_TITLE    = ("Segoe UI", 18, "bold")
+FONT_SUBTITLE = ("Segoe UI", 10)
+FONT_NORMAL   = ("Segoe UI", 11)
+FONT_BUTTON   = ("Segoe UI", 11, "bold")
+FONT_SMALL    = ("Segoe UI", 9)
+
+# ── Launch ───────────────────────────────────────────────────────────────────
+LAUNCH_POLL_MS = 50     # intervallo di aggiornamento della UI durante un lancio
+UI_PUMP_MS = 100        # intervallo con cui vengono eseguite le chiamate arrivate da altri thread
+
+# ── Loading ──────────────────────────────────────────────────────────────────
+LOAD_POLL_MS = 30           # intervallo con cui vengono mostrati i blocchi caricati
+LOAD_ROWS_PER_TICK = 5000   # righe massime aggiunte alla lista per ogni passo
+
+# ── List ─────────────────────────────────────────────────────────────────────
+EMPTY_TEXT = "Nessun elemento configurato.\nUsa i pulsanti ➕ per aggiungere cartelle o URL."
+HIDDEN_BY_FILTER = "  (nascosto dal filtro attivo)"
+
+# ── Config files ─────────────────────────────────────────────────────────────
+CONFIG_FILETYPES = [
+    ("File di configurazione JSON", "*.json"),
+    ("Database SQLite (liste molto grandi)", " ".join("*" + s for s in SQLITE_SUFFIXES)),
+    ("Tutti i file", "*.*"),
+]
+
+# ── Openers ──────────────────────────────────────────────────────────────────
+OPENER_LABELS = {
+    "startfile": "Shell di Windows",
+    "spawn": "Un processo per cartella (xdg-open / gio)",
+    "helper": "Processo di supporto persistente",
+    "fake": "Simulazione (non apre nulla)",
+}
+
+
+class WindowLauncher(tk.Tk):
+    """Main application window."""
+
+    def __init__(self, config_path: str = CONFIG_FILE, server: InstanceServer | None = None):
+        t0 = time.perf_counter()
+        super().__init__()
+        tracer.add("startup.tk", t0, time.perf_counter() - t0, cat="startup")
+        self.configure(bg=BG_DARK)
+        self.minsize(560, 520)
+        self.geometry("620x660")
+        self.resizable(True, True)
+
+        # Percorso del file di configurazione attualmente aperto
+        self._current_config: str = os.path.normpath(config_path)
+
+        # Internal items list: Item(name, path, type), indicizzati per percorso
+        # type can be: "folder", "url"
+        self.items = ItemStore()
+
+        # Lancio in corso (None se nessuno) e coda degli esiti da mostrare
+        self._launch_run: LaunchRun | None = None
+        self._launch_events: queue.SimpleQueue = queue.SimpleQueue()
+        self._launch_poll_id = None
+        self._last_run: LaunchRun | None = None     # per la finestra di diagnostica
+
+        # Caricamento in corso (None se nessuno) e coda dei blocchi ricevuti
+        self._load: ConfigLoad | None = None
+        self._load_events: queue.SimpleQueue = queue.SimpleQueue()
+        self._load_poll_id = None
+        self._load_partial = False      # ultimo caricamento annullato: la lista è incompleta
+        self._partial_edits = False     # modifiche alla lista incompleta non salvate
+        self._save_after_load = False   # salvataggio richiesto durante il caricamento
+        self._launch_after_load = False  # lancio richiesto da un'altra invocazione
+
+        # Richieste inoltrate dalle invocazioni successive (modalità istanza singola)
+        self._server = server
+
+        # Chiamate inviate dai thread in background, eseguite sul thread della UI
+        self._ui_calls: queue.SimpleQueue = queue.SimpleQueue()
+        self._pump_id = None
+
+        # Config già letti: tornare a un file non modificato non lo rilegge dal disco.
+        # Anche i nostri salvataggi aggiornano la cache, così restano validi.
+        self._configs = ConfigCache()
+
+        # Salvataggi in background (accorpati e atomici)
+        self._saver = ConfigSaver(on_error=self._on_save_error, on_saved=self._on_saved)
+
+        # Sorveglianza del config aperto e rilettura dopo una modifica esterna
+        self._watcher: FileWatcher | None = None
+        self._reload: ConfigLoad | None = None
+        self._external_during_save: str | None = None   # modifica esterna arrivata con un salvataggio in attesa
+
+        # Verifica delle cartelle in background, con esiti in cache condivisi col lancio
+        self._existence = ExistenceCache()
+        self._preflight = Preflight(self._existence)
+        self._preflight_cancel: threading.Event | None = None
+        self._marks_pending: set[str] = set()
+        self._marks_id = None
+
+        # Ricerca: l'indice viene costruito alla prima ricerca e poi aggiornato a ogni modifica.
+        # _shown sono gli elementi che corrispondono al filtro, nell'ordine della lista (None: nessun filtro)
+        self._search = SearchIndex()
+        self._shown: list[Item] | None = None
+        self._shown_query = ""
+        self._search_id = None
+
+        with tracer.span("startup.build_menu", cat="startup"):
+            self._build_menu()
+        with tracer.span("startup.build_ui", cat="startup"):
+            self._build_ui()
+        self._set_current_config(self._current_config)  # aggiorna titolo e label header
+        self._startup_load = None
+        # Caricamento e drag & drop dopo il primo frame, quando il ciclo degli eventi è partito
+        self._startup_id = self.after_idle(self._finish_startup)
+        self._pump_id = self.after(UI_PUMP_MS, self._pump_ui_calls)
+
+    def _finish_startup(self):
+        """Prima callback idle: la finestra è disegnata e risponde agli eventi."""
+        self._startup_id = None
+        tracer.add("startup.interactive", tracer.origin, time.perf_counter() - tracer.origin,
+                   cat="startup")
+        # Chiusa quando il primo caricamento termina (in background)
+        self._startup_load = tracer.begin("startup.load_config", cat="startup")
+        self._load_config(self._current_config)
+        with tracer.span("startup.setup_dnd", cat="startup"):
+            self._setup_dnd()
+        if self._server is not None:
+            self._server.serve(lambda action, path: self._post(self._on_forward, action, path))
+
+    # ── Cross-thread calls ───────────────────────────────────────────────────
+
+    def _post(self, fn, *args):
+        """Esegue ``fn(*args)`` sul thread della UI; sicuro da qualsiasi thread."""
+        self._ui_calls.put((fn, args))
+
+    def _pump_ui_calls(self):
+        while True:
+            try:
+                fn, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                # Come per le callback di Tk: l'errore si segnala, la coda continua a girare
+                self.report_callback_exception(*sys.exc_info())
+        self._pump_id = self.after(UI_PUMP_MS, self._pump_ui_calls)
+
+    # ── Title helper ─────────────────────────────────────────────────────────
+
+    def _update_title(self):
+        name = os.path.basename(self._current_config)
+        self.title(f"🗂  Window Launcher V.0.7.1  —  {name}")
+
+    # ── Drag & Drop ──────────────────────────────────────────────────────────
+
+    def _setup_dnd(self):
+        """
+        Registra la finestra come drop target (richiede tkinterdnd2).
+
+        L'estensione tkdnd viene caricata nell'interprete già creato, invece di
+        usare ``TkinterDnD.Tk`` come classe base, così non rallenta il primo frame.
+        """
+        try:
+            from tkinterdnd2 import DND_FILES, TkinterDnD
+            TkinterDnD._require(self)
+        except (ImportError, RuntimeError):
+            return
+
+        def drop(data):
+            self._on_drop(data)
+            return "copy"
+
+        # Registra sia la finestra principale che il listbox come target
+        command = self.register(drop)
+        for widget in (self, self.listbox):
+            self.tk.call("tkdnd::drop_target", "register", str(widget), (DND_FILES,))
+            self.tk.call("bind", str(widget), "<<Drop>>", f"{command} %D")
+
+    def _on_drop(self, data: str):
+        """Chiamato quando un file viene trascinato nella finestra (``data``: lista Tcl dei file)."""
+        raw = data.strip()
+        # tkinterdnd2 su Windows racchiude path con spazi in {}, gestiamo entrambi i casi
+        if raw.startswith("{") and raw.endswith("}"):
+            path = raw[1:-1]
+        else:
+            # Prende solo il primo file se ne vengono droppati più di uno
+            path = raw.split("} {")[0].lstrip("{").rstrip("}")
+
+        path = os.path.normpath(path)
+
+        if not path.lower().endswith((".json",) + SQLITE_SUFFIXES):
+            messagebox.showwarning(
+                "Formato non supportato",
+                f"Trascina solo file di configurazione .json o .sqlite.\n\nFile ricevuto:\n{path}"
+            )
+            return
+
+        self._open_path(path)
+
+    def _open_path(self, path: str):
+        """Apre il config indicato (drag & drop, menu, richieste inoltrate)."""
+        path = os.path.normpath(path)
+        self._load_config(path)
+        self._set_current_config(path)
+
+    def _on_forward(self, action: str, path: str | None):
+        """Richiesta di un'altra invocazione: apre (e se richiesto lancia) il config."""
+        self.deiconify()
+        self.lift()
+        self.focus_force()
+        if action == "focus":
+            return  # avviata senza un config: resta aperto quello attuale
+        self._open_path(path)
+        if action == "launch" and self._load is not None:
+            self._launch_after_load = True
+
+    # ── Menu bar ─────────────────────────────────────────────────────────────
+
+    def _build_menu(self):
+        menubar = tk.Menu(self, bg=BG_CARD, fg=FG_TEXT,
+                          activebackground=ACCENT, activeforeground="#ffffff",
+                          relief="flat", bd=0)
+
+        file_menu = tk.Menu(menubar, tearoff=0,
+                            bg=BG_CARD, fg=FG_TEXT,
+                            activebackground=ACCENT, activeforeground="#ffffff",
+                            relief="flat")
+
+        file_menu.add_command(label="📂  Nuova configurazione",
+                              command=self._new_config,
+                              accelerator="Ctrl+N")
+        file_menu.add_command(label="📁  Apri configurazione…",
+                              command=self._open_config,
+                              accelerator="Ctrl+O")
+        file_menu.add_separator()
+        file_menu.add_command(label="💾  Salva",
+                              command=self._save_config_current,
+                              accelerator="Ctrl+S")
+        file_menu.add_command(label="💾  Salva con nome…",
+                              command=self._save_config_as,
+                              accelerator="Ctrl+Shift+S")
+        file_menu.add_separator()
+        file_menu.add_command(label="❌  Esci", command=self.destroy)
+
+        menubar.add_cascade(label="File", menu=file_menu)
+
+        options_menu = tk.Menu(menubar, tearoff=0,
+                               bg=BG_CARD, fg=FG_TEXT,
+                               activebackground=ACCENT, activeforeground="#ffffff",
+                               relief="flat")
+        opener_menu = tk.Menu(options_menu, tearoff=0,
+                              bg=BG_CARD, fg=FG_TEXT,
+                              activebackground=ACCENT, activeforeground="#ffffff",
+                              relief="flat")
+        # Backend di apertura delle cartelle, salvato nel config corrente
+        self.opener_var = tk.StringVar(value=default_opener_name())
+        for name in selectable_openers():
+            opener_menu.add_radiobutton(label=OPENER_LABELS.get(name, name), value=name,
+                                        variable=self.opener_var,
+                                        command=self._on_opener_changed)
+        options_menu.add_cascade(label="📂  Apri cartelle con", menu=opener_menu)
+        options_menu.add_separator()
+        options_menu.add_command(label="🩺  Diagnostica…", command=self._show_diagnostics)
+
+        menubar.add_cascade(label="Opzioni", menu=options_menu)
+        self.config(menu=menubar)
+
+        # Keyboard shortcuts
+        self.bind_all("<Control-n>", lambda e: self._new_config())
+        self.bind_all("<Control-o>", lambda e: self._open_config())
+        self.bind_all("<Control-s>", lambda e: self._save_config_current())
+        self.bind_all("<Control-S>", lambda e: self._save_config_as())
+        self.bind_all("<Escape>", lambda e: self._on_escape())
+        # Tornando alla finestra il config viene ricontrollato subito
+        self.bind("<FocusIn>", lambda e: self._watcher and self._watcher.check_now())
+
+    # ── UI construction ──────────────────────────────────────────────────────
+
+    def _build_ui(self):
+        # Header
+        header = tk.Frame(self, bg=BG_DARK)
+        header.pack(fill="x", padx=24, pady=(20, 4))
+
+        tk.Label(
+            header, text="🗂  Window Launcher", font=FONT_TITLE,
+            bg=BG_DARK, fg=FG_TEXT
+        ).pack(anchor="w")
+        tk.Label(
+            header, text="Configura cartelle e URL da aprire contemporaneamente",
+            font=FONT_SUBTITLE, bg=BG_DARK, fg=FG_SECONDARY
+        ).pack(anchor="w", pady=(2, 0))
+
+        # Current config label
+        self.config_label_var = tk.StringVar()
+        tk.Label(
+            header, textvariable=self.config_label_var,
+            font=FONT_SMALL, bg=BG_DARK, fg=ACCENT, anchor="w"
+        ).pack(anchor="w", pady=(4, 0))
+
+        # Separator
+        tk.Frame(self, bg=BORDER, height=1).pack(fill="x", padx=24, pady=12)
+
+        # ── Listbox card ─────────────────────────────────────────────────────
+        card = tk.Frame(self, bg=BG_CARD, bd=0, highlightthickness=1,
+                        highlightbackground=BORDER)
+        card.pack(fill="both", expand=True, padx=24, pady=(0, 8))
+
+        # Search box (filtra mentre si scrive)
+        search_bar = tk.Frame(card, bg=BG_CARD)
+        search_bar.pack(fill="x", padx=12, pady=(12, 0))
+        tk.Label(search_bar, text="🔍", font=FONT_NORMAL, bg=BG_CARD, fg=FG_SECONDARY).pack(side="left")
+        self.search_var = tk.StringVar()
+        self.search_entry = tk.Entry(
+            search_bar, textvariable=self.search_var,
+            bg=BG_INPUT, fg=FG_TEXT, insertbackground=FG_TEXT, font=FONT_NORMAL,
+            bd=0, highlightthickness=0, relief="flat",
+        )
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(6, 0), ipady=4)
+        self.search_entry.bind("<FocusIn>", lambda e: self._activate_search())
+        self.search_entry.bind("<Return>", lambda e: self._launch_filtered())
+        self.search_entry.bind("<Escape>", self._on_search_escape)
+        self.search_var.trace_add("write", lambda *_: self._schedule_filter())
+        # Mostrato solo mentre un filtro è attivo
+        self.filter_launch_btn = self._make_button(search_bar, "🚀 Lancia filtrati", self._launch_filtered,
+                                                   SUCCESS, SUCCESS_HOVER)
+
+        # Listbox + scrollbar
+        list_frame = tk.Frame(card, bg=BG_CARD)
+        list_frame.pack(fill="both", expand=True, padx=12, pady=12)
+
+        scrollbar = tk.Scrollbar(list_frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+
+        self.listbox = tk.Listbox(
+            list_frame,
+            bg=BG_INPUT, fg=FG_TEXT,
+            selectbackground=ACCENT,
+            selectforeground="#ffffff",
+            font=FONT_NORMAL,
+            bd=0,
+            highlightthickness=0,
+            relief="flat",
+            activestyle="none",
+            yscrollcommand=scrollbar.set,
+        )
+        self.listbox.pack(fill="both", expand=True)
+        self.listbox.bind("<Double-Button-1>", self._on_double_click)
+        scrollbar.config(command=self.listbox.yview)
+        self.view = ListboxView(self.listbox, status_of=self._row_status)
+
+        # Empty-state label (shown when list is empty)
+        self.empty_label = tk.Label(
+            list_frame,
+            text=EMPTY_TEXT,
+            font=FONT_SMALL, bg=BG_INPUT, fg=FG_SECONDARY,
+            justify="center"
+        )
+
+        # ── Side buttons (add / remove) ──────────────────────────────────────
+        btn_side = tk.Frame(card, bg=BG_CARD)
+        btn_side.pack(fill="x", padx=12, pady=(0, 12))
+
+        self._make_button(btn_side, "📁 Cartella", self._add_folder,
+                          SUCCESS, SUCCESS_HOVER).pack(side="left", padx=(0, 6))
+        self._make_button(btn_side, "🌐 URL", self._add_url,
+                          SUCCESS, SUCCESS_HOVER).pack(side="left", padx=(0, 6))
+        self._make_button(btn_side, "🗑 Rimuovi", self._remove_item,
+                          ACCENT, ACCENT_HOVER).pack(side="right")
+
+        # ── Bottom action bar ────────────────────────────────────────────────
+        action_bar = tk.Frame(self, bg=BG_DARK)
+        action_bar.pack(fill="x", padx=24, pady=(8, 20))
+
+        self._make_button(action_bar, "🧹  Pulisci Tutto", self._clear_all,
+                          "#ff9f43", "#feca57", width=16).pack(side="left")
+        self.launch_btn = self._make_button(action_bar, "🚀  Lancia Tutto!", self._launch_all,
+                                            ACCENT, ACCENT_HOVER, width=16)
+        self.launch_btn.pack(side="right")
+
+        # Status bar
+        self.status_var = tk.StringVar(value="Pronto")
+        tk.Label(
+            self, textvariable=self.status_var, font=FONT_SMALL,
+            bg=BG_DARK, fg=FG_SECONDARY, anchor="w"
+        ).pack(fill="x", padx=24, pady=(0, 8))
+
+    # ── Button helper ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _make_button(parent, text, command, bg, hover_bg, width=None):
+        btn = tk.Button(
+            parent, text=text, command=command,
+            font=FONT_BUTTON, bg=bg, fg="#ffffff",
+            activebackground=hover_bg, activeforeground="#ffffff",
+            bd=0, relief="flat", cursor="hand2",
+            padx=14, pady=6,
+        )
+        if width:
+            btn.config(width=width)
+
+        def on_enter(_):
+            btn.config(bg=hover_bg)
+
+        def on_leave(_):
+            btn.config(bg=bg)
+
+        btn.bind("<Enter>", on_enter)
+        btn.bind("<Leave>", on_leave)
+        return btn
+
+    # ── Listbox helpers ──────────────────────────────────────────────────────
+
+    def _refresh_listbox(self):
+        """Ricostruisce la lista (a blocchi, se lunga); per le modifiche usare self.view."""
+        rows = self._rows()
+        with tracer.span("render.refresh", cat="render", rows=len(rows)):
+            self.view.reset(rows)
+            self._update_empty_state()
+
+    def _rows(self):
+        """Elementi mostrati nel listbox, riga per riga: quelli filtrati oppure tutti."""
+        return self._shown if self._shown is not None else self.items
+
+    def _update_empty_state(self):
+        # Show / hide empty-state label
+        if not self.items:
+            self.empty_label.config(text=EMPTY_TEXT)
+            self.empty_label.place(relx=0.5, rely=0.5, anchor="center")
+        elif self._shown is not None and not self._shown:
+            self.empty_label.config(text=f"Nessun elemento corrisponde a «{self._shown_query}».")
+            self.empty_label.place(relx=0.5, rely=0.5, anchor="center")
+        else:
+            self.empty_label.place_forget()
+
+    def _set_current_config(self, path: str):
+        """Aggiorna il file di configurazione corrente e le label collegate."""
+        self._current_config = path
+        self._update_title()
+        self.config_label_var.set(f"📄  {path}")
+        self._watch(path)
+
+    # ── Actions ──────────────────────────────────────────────────────────────
+
+    def _on_double_click(self, event):
+        """Apre l'elemento corrispondente alla riga su cui si è fatto doppio click."""
+        sel = self.listbox.curselection()
+        if not sel:
+            return
+        idx = sel[0]
+        rows = self._rows()
+        if idx < len(rows):
+            self._launch_item(rows[idx])
+
+    # ── Add helpers ──────────────────────────────────────────────────────────
+
+    def _add_folder(self):
+        path = filedialog.askdirectory(title="Scegli una cartella")
+        if not path:
+            return
+        if self._select_existing(path):
+            return
+        name = os.path.basename(path) or path
+        item = Item(name, path, FOLDER)
+        shown = self._append_item(item)
+        if self._save_config_current():
+            self.status_var.set(f"Aggiunta cartella: {name}{'' if shown else HIDDEN_BY_FILTER}")
+        self._start_preflight([item], cancel_previous=False)
+
+    def _add_url(self):
+        url = simpledialog.askstring(
+            "Aggiungi URL",
+            "Inserisci l'URL da aprire:",
+            parent=self,
+        )
+        if not url:
+            return
+        # Assicura che l'URL abbia un protocollo
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+        # Usa il dominio come nome
+        if self._select_existing(url):
+            return
+        name = url.replace("https://", "").replace("http://", "").split("/")[0]
+        item = Item(name, url, URL)
+        shown = self._append_item(item)
+        if self._save_config_current():
+            self.status_var.set(f"Aggiunto URL: {name}{'' if shown else HIDDEN_BY_FILTER}")
+
+    def _append_item(self, item: Item) -> bool:
+        """Aggiunge un elemento in coda; restituisce False se il filtro attivo lo nasconde."""
+        self.items.append(item)
+        self._search.add([item])
+        shown = self._shown is None or self._search.matches(item, self._shown_query)
+        if shown:
+            if self._shown is not None:
+                self._shown.append(item)
+            self.view.append(item)
+        self._update_empty_state()
+        return shown
+
+    def _select_existing(self, path: str) -> bool:
+        """Se il percorso è già in lista seleziona la sua riga e restituisce True."""
+        item = self.items.find(path)
+        if item is None:
+            return False
+        idx = position(self._rows(), item)
+        if idx < 0:
+            # Nascosto dal filtro: si torna alla lista completa
+            self._clear_filter()
+            idx = self.items.index_of(path)
+        self.view.finish_fill()
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(idx)
+        self.listbox.see(idx)
+        self.status_var.set(f"Già presente: {item.name}")
+        return True
+
+    def _remove_item(self):
+        sel = self.listbox.curselection()
+        if not sel:
+            messagebox.showwarning("Attenzione", "Seleziona un elemento dalla lista.")
+            return
+        idx = sel[0]
+        if self._shown is not None:
+            removed = self._shown.pop(idx)
+            self.items.pop(position(self.items, removed))
+        else:
+            removed = self.items.pop(idx)
+        self._search.remove([removed])
+        self.view.remove(idx)
+        self._update_empty_state()
+        if self._save_config_current():
+            self.status_var.set(f"Rimosso: {removed.name}")
+
+    def _clear_all(self):
+        if not self.items:
+            messagebox.showinfo("Info", "La lista è già vuota.")
+            return
+        if messagebox.askyesno("Conferma", "Vuoi rimuovere tutti gli elementi dalla lista?"):
+            self._cancel_load()
+            self._clear_filter(render=False)
+            self.items.clear()
+            self._search.clear()
+            self.view.clear()
+            self._update_empty_state()
+            self.status_var.set("Lista svuotata (il file non è stato modificato) ✔")
+
+    # ── Search ───────────────────────────────────────────────────────────────
+
+    def _activate_search(self):
+        """Costruisce l'indice in background alla prima ricerca (o dopo che la lista è cambiata)."""
+        if self._load is None and self._search.stale:
+            self._search.build(self.items)
+
+    def _schedule_filter(self):
+        # Più tasti premuti prima del prossimo frame producono una sola ricerca
+        if self._search_id is None:
+            self._search_id = self.after_idle(self._apply_filter)
+
+    def _apply_filter(self):
+        self._search_id = None
+        query = self.search_var.get().strip()
+        if query == self._shown_query:
+            return
+        if not query:
+            self._set_filter(None, "")
+            return
+        self._activate_search()
+        within = None
+        if self._shown is not None and refines(query, self._shown_query):
+            within = self._shown
+        self._set_filter(self._search.search(query, self.items, within=within), query)
+
+    def _set_filter(self, shown: list[Item] | None, query: str):
+        self._shown = shown
+        self._shown_query = query
+        self._refresh_listbox()
+        if shown is None:
+            self.filter_launch_btn.pack_forget()
+            return
+        self.filter_launch_btn.pack(side="right", padx=(6, 0))
+        self._set_status(f"{len(shown)} di {len(self.items)} elementi corrispondono a «{query}»"
+                         "  —  Invio per lanciarli")
+
+    def _clear_filter(self, render: bool = True):
+        """Toglie il filtro; con ``render=False`` il chiamante ricostruisce la lista da sé."""
+        if self._search_id is not None:
+            self.after_cancel(self._search_id)
+            self._search_id = None
+        if self.search_var.get():
+            self.search_var.set("")     # la ricerca pianificata dalla trace non troverà differenze
+        if self._shown is None:
+            return
+        if render:
+            self._set_filter(None, "")
+        else:
+            self._shown = None
+            self._shown_query = ""
+            self.filter_launch_btn.pack_forget()
+
+    def _on_search_escape(self, event):
+        """Esc nella casella di ricerca toglie il filtro; se è già vuota annulla come altrove."""
+        if not self.search_var.get():
+            return None
+        self._clear_filter()
+        return "break"
+
+    # ── Launch logic ─────────────────────────────────────────────────────────
+
+    def _launch_item(self, item):
+        """Lancia un singolo elemento in background."""
+        if self._launch_run is not None:
+            self.status_var.set("Lancio già in corso…")
+            return
+        self._start_launch([item])
+
+    def _launch_all(self):
+        if self._launch_run is not None:
+            # Il pulsante funge da "Annulla" durante un lancio
+            self._launch_run.cancel()
+            self.status_var.set("Annullamento in corso…")
+            return
+        if not self.items:
+            messagebox.showinfo("Info", "Nessun elemento da aprire.\nAggiungi almeno un elemento.")
+            return
+        self._start_launch(self.items)
+
+    def _launch_filtered(self):
+        """Lancia solo gli elementi che corrispondono alla ricerca."""
+        if self._shown is None:
+            return
+        if self._launch_run is not None:
+            self.status_var.set("Lancio già in corso…")
+            return
+        if not self._shown:
+            self.status_var.set(f"Nessun elemento corrisponde a «{self._shown_query}»")
+            return
+        self._start_launch(list(self._shown))
+
+    def _start_launch(self, items):
+        """Avvia il lancio sui thread worker e inizia a raccoglierne gli esiti."""
+        events = self._launch_events
+        run = LaunchRun(items, opener=self._current_opener(), cache=self._existence,
+                        on_result=events.put, on_finish=events.put,
+                        **launch_settings(self.items.meta))
+        self._launch_run = run
+        self.launch_btn.config(text="⏹  Annulla")
+        self.status_var.set(f"Lancio in corso… 0/{run.total}")
+        run.start()
+        self._launch_poll_id = self.after(LAUNCH_POLL_MS, self._poll_launch)
+
+    def _poll_launch(self):
+        """Svuota la coda degli esiti e aggiorna la barra di stato una volta per batch."""
+        self._launch_poll_id = None
+        run = self._launch_run
+        finished = False
+        last = None
+        while True:
+            try:
+                event = self._launch_events.get_nowait()
+            except queue.Empty:
+                break
+            if event is run:
+                finished = True
+            elif isinstance(event, LaunchResult):
+                last = event
+        if run is None:
+            return
+        if finished:
+            self._finish_launch(run)
+            return
+        if last is not None:
+            failed = len(run.failures)
+            msg = f"Lancio in corso… {len(run.results)}/{run.total}  —  {last.item.name}"
+            if failed:
+                msg += f"  ({failed} errori)"
+            self.status_var.set(msg)
+        self._launch_poll_id = self.after(LAUNCH_POLL_MS, self._poll_launch)
+
+    def _finish_launch(self, run: LaunchRun):
+        self._launch_run = None
+        self._last_run = run
+        self.launch_btn.config(text="🚀  Lancia Tutto!")
+        failures = run.failures
+        opened = len(run.results) - len(failures)
+        if run.cancelled:
+            msg = f"Lancio annullato: {opened}/{run.total} elementi aperti in {run.elapsed:.2f}s"
+        elif run.total == 1 and not failures:
+            msg = f"Aperto: {run.items[0].name} ({run.elapsed:.2f}s)"
+        else:
+            msg = f"Lanciati {opened} elementi in {run.elapsed:.2f}s ✔"
+        if failures:
+            msg += f"  —  {len(failures)} errori"
+        slowest = run.slowest(1)
+        if run.total > 1 and slowest:
+            msg += f"  —  più lento: {slowest[0].item.name} ({slowest[0].elapsed:.2f}s)"
+        self.status_var.set(msg)
+        if failures:
+            # Un unico riepilogo a fine lancio, non un messagebox per ogni errore
+            lines = [f"• {r.item.name}: {r.error}" for r in failures[:10]]
+            if len(failures) > 10:
+                lines.append(f"… e altri {len(failures) - 10}")
+            messagebox.showwarning("Elementi non aperti", "\n".join(lines))
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def _save_config_current(self) -> bool:
+        """
+        Salva nel file di configurazione attualmente attivo. Restituisce False se
+        la lista è incompleta e non viene salvata: l'avviso resta nella barra di stato.
+        """
+        if self._load is not None:
+            # Il file verrà salvato a caricamento completato
+            self._save_after_load = True
+            return True
+        if self._load_partial:
+            self._partial_edits = True
+            self._set_status("Lista incompleta: usa «Salva con nome…» per salvarla")
+            return False
+        self._write_config(self._current_config)
+        return True
+
+    def _save_config_as(self):
+        """Chiede un nuovo percorso e salva lì la configurazione corrente."""
+        if self._load is not None:
+            self._set_status("Attendi la fine del caricamento prima di salvare")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Salva configurazione con nome",
+            defaultextension=".json",
+            filetypes=CONFIG_FILETYPES,
+            initialdir=APP_DIR,
+        )
+        if not path:
+            return
+        path = os.path.normpath(path)  # normalizza slash su Windows
+        self._write_config(path)
+        self._load_partial = self._partial_edits = False
+        self._set_current_config(path)
+        self.status_var.set(f"Configurazione salvata come: {os.path.basename(path)}")
+
+    def _open_config(self):
+        """Apre un file di configurazione esistente."""
+        path = filedialog.askopenfilename(
+            title="Apri configurazione",
+            defaultextension=".json",
+            filetypes=CONFIG_FILETYPES,
+            initialdir=APP_DIR,
+        )
+        if not path:
+            return
+        self._open_path(path)
+
+    def _new_config(self):
+        """Riparte con una lista vuota senza toccare il file corrente."""
+        if self.items:
+            if not messagebox.askyesno(
+                "Nuova configurazione",
+                "Vuoi creare una nuova configurazione vuota?\n"
+                "Le modifiche non salvate andranno perse."
+            ):
+                return
+        self._cancel_load()
+        self._clear_filter(render=False)
+        self.items.clear()
+        self.items.meta = {}
+        self._search.clear()
+        self.view.clear()
+        self._update_empty_state()
+        self._sync_opener_var()
+        self._set_current_config(CONFIG_FILE)
+        self.status_var.set("Nuova configurazione creata")
+
+    def _write_config(self, path: str):
+        """Pianifica la scrittura di self.items nel file indicato (in background)."""
+        self._saver.save(path, self.items, self.items.meta)
+
+    def _on_saved(self, path: str, items, meta, stat):
+        # Chiamato dal thread di salvataggio: il file scritto da noi non va ricaricato
+        self._configs.put(path, items, meta, stat)
+        watcher = self._watcher
+        if watcher is not None and watcher.path == path:
+            watcher.acknowledge(stat)
+            self._post(self._recheck_after_save, path, stat)
+
+    def _on_save_error(self, path: str, error: Exception):
+        # Chiamato dal thread di salvataggio
+        self._post(messagebox.showerror, "Errore",
+                   f"Impossibile salvare {os.path.basename(path)}:\n{error}")
+
+    def _load_config(self, path: str):
+        """Avvia il caricamento del config in background; gli elementi arrivano a blocchi."""
+        path = os.path.normpath(path)  # normalizza slash su Windows
+        self._cancel_load()
+        self._launch_after_load = False
+        self._clear_filter(render=False)
+        self.items.clear()
+        self.items.meta = {}
+        self._search.clear()    # ricostruito a caricamento completato
+        self.view.clear()
+        self._update_empty_state()
+        self._sync_opener_var()
+        if not os.path.exists(path):
+            self._set_status(f"File non trovato: {os.path.basename(path)}")
+            self._end_startup_load()
+            return
+        # Una coda nuova per ogni caricamento: i blocchi di uno precedente vengono ignorati
+        events = self._load_events = queue.SimpleQueue()
+        self._load = ConfigLoad(
+            path,
+            on_batch=lambda load, batch, progress: events.put((batch, progress)),
+            on_finish=events.put,
+            cache=self._configs,
+        ).start()
+        self._set_status(f"Caricamento di {os.path.basename(path)}…  (Esc per annullare)")
+        self._load_poll_id = self.after(LOAD_POLL_MS, self._poll_load)
+
+    def _poll_load(self):
+        """Aggiunge alla lista i blocchi arrivati, al massimo LOAD_ROWS_PER_TICK righe per volta."""
+        self._load_poll_id = None
+        load = self._load
+        if load is None:
+            return
+        rows = 0
+        progress = None
+        finished = False
+        t0 = time.perf_counter()
+        while rows < LOAD_ROWS_PER_TICK:
+            try:
+                event = self._load_events.get_nowait()
+            except queue.Empty:
+                break
+            if event is load:
+                finished = True
+                break
+            batch, progress = event
+            self.items.extend(batch)
+            if self._shown is not None:
+                # Filtro digitato durante il caricamento: si mostrano solo i nuovi elementi che corrispondono
+                batch = self._search.search(self._shown_query, batch)
+                self._shown.extend(batch)
+            self.view.extend(batch)
+            rows += len(batch)
+        if rows:
+            self._update_empty_state()
+            tracer.add("render.load_batch", t0, time.perf_counter() - t0, cat="render", rows=rows)
+        if finished:
+            self._finish_load(load)
+            return
+        if progress is not None:
+            self._set_status(
+                f"Caricamento di {os.path.basename(load.path)}… {progress:.0%}"
+                f"  ({len(self.items)} elementi)  —  Esc per annullare"
+            )
+        self._load_poll_id = self.after(LOAD_POLL_MS, self._poll_load)
+
+    def _finish_load(self, load: ConfigLoad):
+        self._load = None
+        self._end_startup_load()
+        save_after_load, self._save_after_load = self._save_after_load, False
+        launch_after_load, self._launch_after_load = self._launch_after_load, False
+        name = os.path.basename(load.path)
+        if load.error is not None:
+            self.items.clear()
+            self.view.clear()
+            self._update_empty_state()
+            messagebox.showerror(
+                "Errore lettura configurazione",
+                f"Impossibile leggere il file:\n{load.path}\n\nDettaglio: {load.error}"
+            )
+            self._set_status(f"Configurazione aperta (vuota): {name}")
+            return
+        self.items.meta = load.meta
+        self._sync_opener_var()
+        if self._search.active:
+            self._search.build(self.items)
+        if load.cancelled:
+            self._load_partial = True
+            self._set_status(
+                f"Caricamento annullato: {len(self.items)} elementi caricati da {name} (lista incompleta)"
+            )
+            return
+        if self.items:
+            source = " (dalla cache)" if load.cached else ""
+            self._set_status(f"Caricati {len(self.items)} elementi da {name}{source}")
+        else:
+            self._set_status(f"Configurazione aperta (vuota): {name}")
+        if save_after_load:
+            self._save_config_current()
+        self._start_preflight(self.items)
+        if launch_after_load and self.items and self._launch_run is None:
+            self._start_launch(self.items)
+
+    def _end_startup_load(self):
+        if self._startup_load is not None:
+            tracer.end(self._startup_load, items=len(self.items))
+            self._startup_load = None
+
+    def _cancel_load(self):
+        """Abbandona un caricamento in corso senza aggiornare la lista."""
+        if self._preflight_cancel is not None:
+            self._preflight_cancel.set()
+            self._preflight_cancel = None
+        for load in (self._load, self._reload):
+            if load is not None:
+                load.cancel()
+        self._load = self._reload = None
+        if self._load_poll_id is not None:
+            self.after_cancel(self._load_poll_id)
+            self._load_poll_id = None
+        self._load_partial = self._partial_edits = False
+        self._save_after_load = False
+
+    # ── Live reload ──────────────────────────────────────────────────────────
+
+    def _watch(self, path: str):
+        """Sorveglia ``path`` al posto del config precedente."""
+        if self._watcher is not None:
+            if self._watcher.path == path:
+                return
+            self._watcher.stop()
+        self._watcher = FileWatcher(
+            path, on_change=lambda p, stat: self._post(self._on_config_changed, p, stat)).start()
+
+    def _on_config_changed(self, path: str, stat):
+        """Il config è cambiato su disco: lo rilegge in background."""
+        if path != self._current_config or self._load is not None or self._load_partial:
+            return  # un caricamento in corso leggerà comunque la versione nuova
+        if self._watcher.is_own(stat):
+            return  # modifica nostra
+        if self._saver.pending:
+            # Un nostro salvataggio sta per scrivere il file: si ricontrolla quando è arrivato
+            self._external_during_save = path
+            return
+        if stat is None:
+            self._set_status(f"⚠  {os.path.basename(path)} è stato rimosso dal disco")
+            return
+        if self._reload is not None:
+            self._reload.cancel()
+        items: list[Item] = []
+        self._reload = ConfigLoad(
+            path,
+            on_batch=lambda load, batch, progress: items.extend(batch),
+            on_finish=lambda load: self._post(self._apply_reload, load, items),
+            cache=self._configs,
+        ).start()
+
+    def _recheck_after_save(self, path: str, saved):
+        """Dopo un salvataggio arrivato insieme a una modifica esterna: quale versione è rimasta su disco?"""
+        if self._external_during_save != path:
+            return
+        self._external_during_save = None
+        try:
+            current = os.stat(path)
+        except OSError:
+            current = None
+        if file_signature(current) == file_signature(saved):
+            self._set_status(f"⚠  Una modifica esterna di {os.path.basename(path)} "
+                             "è stata sovrascritta dalle modifiche fatte qui")
+        else:
+            self._on_config_changed(path, current)  # su disco c'è la versione esterna: si rilegge
+
+    def _apply_reload(self, load: ConfigLoad, items: list[Item]):
+        """Applica alla lista solo il tratto che differisce dalla versione su disco."""
+        if load is not self._reload:
+            return
+        self._reload = None
+        name = os.path.basename(load.path)
+        if load.cancelled or load.path != self._current_config or self._load is not None:
+            return
+        if load.error is not None:
+            # Spesso un file a metà scrittura: la prossima modifica verrà riletta
+            self._set_status(f"⚠  Modifica esterna di {name} non leggibile: {load.error}")
+            return
+        if self._saver.pending:
+            # Modifiche fatte nel frattempo: il nostro salvataggio la sovrascriverà, lo si verifica dopo
+            self._external_during_save = load.path
+            return
+        start, old_end, new_end = changed_range(self.items, items)
+        with tracer.span("render.reload", cat="render", removed=old_end - start, added=new_end - start):
+            self._search.remove(self.items[start:old_end])
+            self.items.splice(start, old_end, items[start:new_end])
+            self._search.add(items[start:new_end], at_end=new_end == len(items))
+            self.items.meta = load.meta
+            self._sync_opener_var()
+            if self._shown is not None:
+                self._shown = self._search.search(self._shown_query, self.items)
+            self.view.sync(self._rows())
+            self._update_empty_state()
+        self._start_preflight(items[start:new_end], cancel_previous=False)
+        if old_end > start or new_end > start:
+            self._set_status(f"Aggiornato da disco: {name} (−{old_end - start} +{new_end - start})")
+        else:
+            self._set_status(f"Impostazioni aggiornate da disco: {name}")
+
+    # ── Opener backend ───────────────────────────────────────────────────────
+
+    def _current_opener(self) -> Opener:
+        """Backend scelto nel config corrente (quello di sistema se assente o non utilizzabile qui)."""
+        return resolve_opener(self.items.meta)
+
+    def _sync_opener_var(self):
+        self.opener_var.set(self._current_opener().name)
+
+    def _on_opener_changed(self):
+        name = self.opener_var.get()
+        set_setting(self.items.meta, "opener", name)
+        if self._save_config_current():
+            self.status_var.set(f"Apertura cartelle: {OPENER_LABELS.get(name, name)}")
+
+    # ── Pre-flight ───────────────────────────────────────────────────────────
+
+    def _row_status(self, item: Item) -> str | None:
+        """Ultimo esito noto della verifica, mostrato nella riga (solo cartelle)."""
+        return self._existence.last(item.path) if item.type == FOLDER else None
+
+    def _start_preflight(self, items, cancel_previous: bool = True):
+        """Verifica in background le cartelle indicate e segna nella lista quelle problematiche."""
+        paths = [item.path for item in items if item.type == FOLDER]
+        if not paths:
+            return
+        if cancel_previous and self._preflight_cancel is not None:
+            self._preflight_cancel.set()
+        cancel = threading.Event()
+        if cancel_previous:
+            self._preflight_cancel = cancel
+
+        def run():
+            results = self._preflight.check(
+                paths, on_result=lambda path, status: self._post(self._schedule_mark, path),
+                cancel=cancel)
+            if not cancel.is_set():
+                self._post(self._on_preflight_done, results)
+
+        threading.Thread(target=run, name="preflight-run", daemon=True).start()
+
+    def _schedule_mark(self, path: str):
+        # Più esiti arrivati insieme vengono applicati con un solo passaggio sulla lista
+        self._marks_pending.add(path)
+        if self._marks_id is None:
+            self._marks_id = self.after_idle(self._apply_marks)
+
+    def _apply_marks(self):
+        self._marks_id = None
+        pending, self._marks_pending = self._marks_pending, set()
+        with tracer.span("render.marks", cat="render", paths=len(pending)):
+            for i, item in enumerate(self._rows()):
+                if item.path in pending and item.type == FOLDER:
+                    self.view.update(i, item)
+
+    def _on_preflight_done(self, results: dict[str, str]):
+        missing = sum(1 for status in results.values() if status == MISSING)
+        slow = sum(1 for status in results.values() if status == SLOW)
+        if not missing and not slow:
+            return
+        parts = []
+        if missing:
+            parts.append(f"{missing} cartelle non trovate")
+        if slow:
+            parts.append(f"{slow} non rispondono")
+        self._set_status("⚠  " + ", ".join(parts))
+
+    # ── Diagnostics ──────────────────────────────────────────────────────────
+
+    def _diagnostics_text(self) -> str:
+        lines = ["Avvio"]
+        for span in tracer.spans(cat="startup"):
+            lines.append(f"  {span.name:<28} {span.duration * 1000:9.1f} ms")
+
+        run = self._last_run
+        lines.append("")
+        if run is None:
+            lines.append("Nessun lancio in questa sessione")
+        else:
+            lines.append(f"Ultimo lancio: {len(run.results)}/{run.total} elementi in {run.elapsed:.2f}s")
+            lines.append("  Più lenti:")
+            for result in run.slowest(10):
+                mark = "" if result.ok else "  ✖"
+                lines.append(f"  {result.elapsed * 1000:9.1f} ms  {result.item.name}  —  {result.item.path}{mark}")
+            lines.append("  Sequenza (inizio → fine, dall'avvio del lancio):")
+            for result in run.timeline()[:50]:
+                mark = "" if result.ok else "  ✖"
+                lines.append(f"  {(result.start - run.started) * 1000:9.1f} → "
+                             f"{(result.finish - run.started) * 1000:9.1f} ms  {result.item.name}{mark}")
+
+        lines.append("")
+        lines.append("Span registrate (numero, totale, massimo)")
+        for name, entry in sorted(tracer.summary().items()):
+            lines.append(f"  {name:<28} {entry['count']:>7}  {entry['total'] * 1000:10.1f} ms"
+                         f"  {entry['max'] * 1000:9.1f} ms")
+
+        stats = self._saver.stats()
+        lines.append("")
+        lines.append(f"Salvataggi: {stats['writes']} scritture, {stats['coalesced']} accorpati, "
+                     f"{stats['errors']} errori, ultima latenza {stats['last_latency'] * 1000:.1f} ms")
+        lines.append(f"Cache pre-flight: {len(self._existence)} percorsi")
+        cache = self._configs.stats()
+        lines.append(f"Cache config: {cache['entries']} file, {cache['bytes'] / 2**20:.1f}"
+                     f"/{cache['max_bytes'] / 2**20:.0f} MB, {cache['hits']} riusi, "
+                     f"{cache['misses']} letture, {cache['invalidations']} invalidati, "
+                     f"{cache['evictions']} scartati")
+        return "\n".join(lines)
+
+    def _show_diagnostics(self):
+        """Finestra con i tempi di avvio, gli elementi più lenti dell'ultimo lancio e le span."""
+        win = tk.Toplevel(self, bg=BG_DARK)
+        win.title("Diagnostica")
+        win.geometry("720x480")
+        text = tk.Text(win, bg=BG_INPUT, fg=FG_TEXT, font=("Consolas", 10),
+                       bd=0, highlightthickness=0, relief="flat", wrap="none")
+        text.insert("1.0", self._diagnostics_text())
+        text.config(state="disabled")
+        text.pack(fill="both", expand=True, padx=12, pady=(12, 6))
+        bar = tk.Frame(win, bg=BG_DARK)
+        bar.pack(fill="x", padx=12, pady=(0, 12))
+        self._make_button(bar, "💾  Esporta trace…", self._export_trace,
+                          SUCCESS, SUCCESS_HOVER).pack(side="left")
+        self._make_button(bar, "Chiudi", win.destroy, ACCENT, ACCENT_HOVER).pack(side="right")
+
+    def _export_trace(self):
+        path = filedialog.asksaveasfilename(
+            title="Esporta trace",
+            defaultextension=".json",
+            filetypes=[("Chrome trace (JSON)", "*.json"), ("Tutti i file", "*.*")],
+            initialdir=APP_DIR,
+        )
+        if not path:
+            return
+        try:
+            tracer.dump(path, "chrome")
+        except OSError as e:
+            messagebox.showerror("Errore", f"Impossibile esportare la trace:\n{e}")
+            return
+        self._set_status(f"Trace esportata: {os.path.basename(path)}")
+
+    def _on_escape(self):
+        """Esc annulla il caricamento o il lancio in corso."""
+        if self._load is not None:
+            self._load.cancel()
+            self._set_status("Annullamento del caricamento…")
+        elif self._launch_run is not None:
+            self._launch_run.cancel()
+            self.status_var.set("Annullamento in corso…")
+
+    def destroy(self):
+        """Annulla un eventuale lancio e completa i salvataggi in attesa prima di chiudere."""
+        if self._partial_edits and not self._confirm_partial_exit():
+            return
+        if self._launch_run is not None:
+            self._launch_run.cancel()
+        self._cancel_load()
+        for after_id in (self._launch_poll_id, self._pump_id, self._startup_id, self._search_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        if self._marks_id is not None:
+            self.after_cancel(self._marks_id)
+            self._marks_id = None
+        self._launch_poll_id = self._pump_id = self._startup_id = self._search_id = None
+        errors = self._saver.errors
+        if not self._saver.close(timeout=10) or self._saver.errors > errors:
+            messagebox.showerror("Errore", "Alcune modifiche non sono state salvate.")
+        if self._server is not None:
+            self._server.close()
+        if self._watcher is not None:
+            self._watcher.stop()
+        close_openers()
+        super().destroy()
+
+    def _confirm_partial_exit(self) -> bool:
+        """Modifiche a una lista incompleta: propone «Salva con nome…»; False per non uscire."""
+        answer = messagebox.askyesnocancel(
+            "Modifiche non salvate",
+            "La lista è incompleta (caricamento annullato) e le modifiche non sono state salvate.\n"
+            "Vuoi salvarla con nome prima di uscire?"
+        )
+        if answer is None:
+            return False
+        if answer:
+            self._save_config_as()
+            return not self._partial_edits     # dialogo annullato: si resta nella finestra
+        return True
+
+    def _set_status(self, msg: str):
+        """Imposta la barra di stato in modo sicuro (può essere chiamato prima di _build_ui)."""
+        if hasattr(self, "status_var"):
+            self.status_var.set(msg)
+
@@ -0,0 +1,64 @@
+"""
+Processo di supporto del backend ``helper``.
+
+Legge da stdin una richiesta JSON per riga (``{"path": ...}``), apre la
+cartella e risponde con ``{"ok": true}`` o ``{"ok": false, "error": ...}``.
+Se PyGObject è disponibile le cartelle vengono aperte via Gio senza avviare
+nuovi processi; altrimenti si usa il comando di sistema da questo processo,
+molto più leggero da duplicare rispetto alla GUI.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from .openers import _detached, spawn_command
+
+
+def _gio_open():
+    try:
+        import gi
+        gi.require_version("Gio", "2.0")
+        from gi.repository import Gio
+    except (ImportError, ValueError):
+        return None
+
+    def open_path(path: str):
+        Gio.AppInfo.launch_default_for_uri(Gio.File.new_for_path(path).get_uri(), None)
+
+    return open_path
+
+
+def _command_open():
+    if sys.platform == "win32":
+        return os.startfile
+    command = spawn_command()
+    if not command:
+        return None
+
+    def open_path(path: str):
+        subprocess.Popen(command + [path], **_detached())
+
+    return open_path
+
+
+def main() -> int:
+    open_path = _gio_open() or _command_open()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            if open_path is None:
+                raise OSError("Nessun metodo disponibile per aprire le cartelle")
+            open_path(json.loads(line)["path"])
+            reply = {"ok": True}
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Istanza singola: le invocazioni successive passano la richiesta alla finestra già aperta.
+
+La prima istanza ascolta su una socket TCP locale (127.0.0.1, porta scelta dal
+sistema) e scrive porta e token in un file leggibile solo dall'utente. Le
+invocazioni successive leggono il file, inviano una riga JSON
+``{"token": ..., "action": "open" | "launch" | "focus", "path": ...}`` e
+terminano appena ricevono ``{"ok": true}`` (``path`` è null per "focus"). Il token evita che altri processi locali possano
+comandare la finestra; un file rimasto da un'istanza terminata viene ignorato
+perché la connessione fallisce.
+"""
+
+import getpass
+import hmac
+import json
+import os
+import secrets
+import socket
+import tempfile
+import threading
+import time
+
+from .trace import tracer
+
+ACTIONS = ("open", "launch", "focus")     # "focus" porta solo in primo piano la finestra
+FORWARD_TIMEOUT = 5.0       # secondi di attesa della risposta (la prima istanza può essere in avvio)
+REQUEST_TIMEOUT = 2.0       # secondi concessi a un client per inviare la richiesta
+REQUEST_LIMIT = 64 * 1024   # byte massimi di una richiesta
+
+
+def endpoint_path() -> str:
+    """File con porta e token dell'istanza in ascolto, uno per utente."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("LOCALAPPDATA") or tempfile.gettempdir()
+    try:
+        user = getpass.getuser()
+    except (OSError, KeyError):
+        user = "user"
+    return os.path.join(base, f"window_launcher-{user}.instance")
+
+
+def _read_endpoint(path: str) -> dict | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {"port": int(data["port"]), "token": str(data["token"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _readline(conn: socket.socket) -> bytes:
+    data = b""
+    while not data.endswith(b"\n") and len(data) < REQUEST_LIMIT:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def forward_request(action: str, path: str | None = None, endpoint: str | None = None,
+                    timeout: float = FORWARD_TIMEOUT) -> bool:
+    """
+    Inoltra ``action`` sul config ``path`` all'istanza in esecuzione
+    (``path`` None con "focus": la finestra viene solo portata in primo piano).
+
+    Restituisce True se l'istanza ha accettato la richiesta, False se non c'è
+    nessuna istanza raggiungibile (il chiamante procede da solo).
+    """
+    info = _read_endpoint(endpoint or endpoint_path())
+    if info is None:
+        return False
+    request = {"token": info["token"], "action": action,
+               "path": os.path.abspath(path) if path is not None else None}
+    with tracer.span("instance.forward", cat="instance", action=action):
+        try:
+            with socket.create_connection(("127.0.0.1", info["port"]), timeout=timeout) as conn:
+                conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+                reply = json.loads(_readline(conn) or b"{}")
+        except (OSError, ValueError):
+            return False
+    return reply.get("ok") is True
+
+
+class InstanceServer:
+    """
+    Punto di ascolto della prima istanza.
+
+    La socket viene aperta e il file scritto subito, così le invocazioni che
+    arrivano mentre la finestra si sta ancora costruendo restano in coda fino
+    a ``serve()``. ``on_request(action, path)`` è chiamato dal thread di ascolto.
+    """
+
+    def __init__(self, endpoint: str | None = None):
+        self.endpoint = endpoint or endpoint_path()
+        self._token = secrets.token_hex(16)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self._sock.bind(("127.0.0.1", 0))
+            self._sock.listen(8)
+            self.port = self._sock.getsockname()[1]
+            self._write_endpoint()
+        except OSError:
+            self._sock.close()
+            raise
+        self._on_request = None
+        self._thread: threading.Thread | None = None
+        self._closed = threading.Event()
+
+    def _write_endpoint(self):
+        # mkstemp crea il file con permessi 0600: il token resta privato
+        folder = os.path.dirname(self.endpoint) or "."
+        fd, tmp = tempfile.mkstemp(prefix=".instance-", dir=folder)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"port": self.port, "token": self._token, "pid": os.getpid()}, f)
+            os.replace(tmp, self.endpoint)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def serve(self, on_request):
+        """Inizia ad accettare le richieste in un thread in background."""
+        self._on_request = on_request
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def _accept_loop(self):
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                break   # socket chiusa da close()
+            with conn:
+                try:
+                    self._handle(conn)
+                except (OSError, ValueError):
+                    pass
+
+    def _handle(self, conn: socket.socket):
+        conn.settimeout(REQUEST_TIMEOUT)
+        request = json.loads(_readline(conn) or b"{}")
+        if not isinstance(request, dict) or not hmac.compare_digest(
+                str(request.get("token", "")), self._token):
+            return  # nessuna risposta: il client procede da solo
+        action, path = request.get("action"), request.get("path")
+        if action not in ACTIONS or not (isinstance(path, str) or (action == "focus" and path is None)):
+            conn.sendall(b'{"ok": false, "error": "richiesta non valida"}\n')
+            return
+        conn.sendall(b'{"ok": true}\n')
+        tracer.add("instance.request", time.perf_counter(), 0.0, cat="instance", action=action)
+        self._on_request(action, path)
+
+    def close(self):
+        """Smette di ascoltare e rimuove il file, se appartiene ancora a questa istanza."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            # Su Linux solo shutdown() sblocca un accept() in attesa in un altro thread
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+        info = _read_endpoint(self.endpoint)
+        if info is not None and info["token"] == self._token:
+            try:
+                os.remove(self.endpoint)
+            except OSError:
+                pass
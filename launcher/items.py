@@ -0,0 +1,215 @@
+"""
+Elementi configurati e la loro collezione.
+
+Ogni elemento è un ``Item`` con ``__slots__`` (molto più leggero di un dict) e
+tipo internato; ``ItemStore`` mantiene l'ordine della lista e un indice per
+percorso che rende immediati i controlli sui duplicati.
+"""
+
+import sys
+
+FOLDER = sys.intern("folder")
+URL = sys.intern("url")
+
+_BASE_KEYS = ("name", "path", "type")
+
+
+class Item:
+    """Un elemento della lista: cartella o URL."""
+
+    __slots__ = ("name", "path", "type", "extra")
+
+    def __init__(self, name: str, path: str, type: str = FOLDER, extra: dict | None = None):
+        self.name = name
+        self.path = path
+        # Un tipo mancante o non testuale (es. null) vale cartella, come è sempre stato
+        self.type = sys.intern(type) if isinstance(type, str) else FOLDER
+        # Campi sconosciuti del JSON, conservati per non perderli al salvataggio
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Item":
+        if not isinstance(data, dict) or "path" not in data:
+            raise ValueError(f"Elemento non valido: {data!r}")
+        extra = {k: v for k, v in data.items() if k not in _BASE_KEYS}
+        return cls(data.get("name", data["path"]), data["path"], data.get("type", FOLDER), extra or None)
+
+    def to_dict(self) -> dict:
+        data = {"name": self.name, "path": self.path, "type": self.type}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def key(self) -> tuple:
+        """
+        Contenuto dell'elemento, per confrontarlo con un altro. Gli Item restano
+        confrontati per identità (== e hash), così si possono usare in set e dict.
+        """
+        return self.name, self.path, self.type, self.extra
+
+    def __repr__(self):
+        return f"Item({self.name!r}, {self.path!r}, {self.type!r})"
+
+
+def position(items, item) -> int:
+    """Posizione di ``item`` in ``items`` (per identità); -1 se assente."""
+    for i, other in enumerate(items):
+        if other is item:
+            return i
+    return -1
+
+
+def same_item(a: Item, b: Item) -> bool:
+    """Stesso contenuto (nome, percorso, tipo e campi extra)."""
+    return a is b or a.key() == b.key()
+
+
+def changed_range(old, new) -> tuple[int, int, int]:
+    """
+    Tratto in cui due liste differiscono, escludendo prefisso e suffisso comuni:
+    ``old[start:old_end]`` va sostituito con ``new[start:new_end]``.
+    Gli elementi vengono confrontati per contenuto (``same_item``).
+    """
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and same_item(old[start], new[start]):
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and same_item(old[old_end - 1], new[new_end - 1]):
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+class ItemStore:
+    """
+    Lista ordinata di ``Item`` con indice per percorso.
+
+    L'indice associa il percorso all'elemento (non alla posizione), quindi
+    aggiunte e rimozioni non devono rinumerare nulla. I percorsi duplicati già
+    presenti nei config esistenti sono ammessi e vengono contati a parte.
+    """
+
+    __slots__ = ("_items", "_by_path", "_dupes", "meta")
+
+    def __init__(self, items=(), meta: dict | None = None):
+        self._items: list[Item] = []
+        # Altre chiavi di primo livello del config (es. "settings"), riscritte al salvataggio
+        self.meta: dict = meta if meta is not None else {}
+        self._by_path: dict[str, Item] = {}
+        self._dupes: dict[str, int] = {}     # percorso -> occorrenze oltre la prima
+        self.extend(items)
+
+    @classmethod
+    def from_dicts(cls, data) -> "ItemStore":
+        return cls(Item.from_dict(d) for d in data)
+
+    def to_dicts(self) -> list[dict]:
+        return [item.to_dict() for item in self._items]
+
+    # ── Sequence protocol ────────────────────────────────────────────────────
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ItemStore):
+            return (len(self._items) == len(other._items) and self.meta == other.meta
+                    and all(map(same_item, self._items, other._items)))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ItemStore({len(self._items)} elementi)"
+
+    # ── Edits ────────────────────────────────────────────────────────────────
+
+    def append(self, item: Item):
+        self._items.append(item)
+        self._index(item)
+
+    def extend(self, items):
+        for item in items:
+            self._items.append(item)
+            self._index(item)
+
+    def insert(self, index: int, item: Item):
+        self._items.insert(index, item)
+        self._index(item)
+
+    def pop(self, index: int = -1) -> Item:
+        item = self._items.pop(index)
+        self._unindex(item)
+        return item
+
+    def replace(self, index: int, item: Item):
+        self._unindex(self._items[index])
+        self._items[index] = item
+        self._index(item)
+
+    def splice(self, start: int, end: int, items):
+        """Sostituisce gli elementi ``[start:end]`` con ``items`` (anche di lunghezza diversa)."""
+        items = list(items)
+        removed = self._items[start:end]
+        # Prima fuori dalla lista, così un duplicato rimasto può prendere il posto nell'indice
+        del self._items[start:end]
+        for item in removed:
+            self._unindex(item)
+        self._items[start:start] = items
+        for item in items:
+            self._index(item)
+
+    def clear(self):
+        """Svuota la lista; ``meta`` resta invariato."""
+        self._items.clear()
+        self._by_path.clear()
+        self._dupes.clear()
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    def has_path(self, path: str) -> bool:
+        return path in self._by_path
+
+    def find(self, path: str) -> Item | None:
+        return self._by_path.get(path)
+
+    def index_of(self, path: str) -> int:
+        """Posizione del (primo) elemento con questo percorso; -1 se assente."""
+        item = self._by_path.get(path)
+        if item is None:
+            return -1
+        return position(self._items, item)
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _index(self, item: Item):
+        if item.path in self._by_path:
+            self._dupes[item.path] = self._dupes.get(item.path, 0) + 1
+        else:
+            self._by_path[item.path] = item
+
+    def _unindex(self, item: Item):
+        path = item.path
+        extra = self._dupes.get(path)
+        if extra is None:
+            # Già tolto se splice() ha rimosso insieme tutti i duplicati del percorso
+            self._by_path.pop(path, None)
+            return
+        if extra == 1:
+            del self._dupes[path]
+        else:
+            self._dupes[path] = extra - 1
+        if self._by_path[path] is item:
+            # Raro: rimosso l'elemento indicizzato di un percorso duplicato
+            other = next((i for i in self._items if i.path == path and i is not item), None)
+            if other is not None:
+                self._by_path[path] = other
+            else:
+                # Anche gli altri duplicati sono già fuori dalla lista (splice)
+                del self._by_path[path]
+                self._dupes.pop(path, None)
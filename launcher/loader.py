@@ -0,0 +1,129 @@
+"""
+Caricamento di un config in un thread in background.
+
+Gli elementi vengono decodificati in streaming e consegnati a blocchi, così la
+GUI può mostrarli man mano che arrivano e l'operazione può essere annullata.
+Con una ``ConfigCache`` un file non modificato dall'ultima lettura non viene riletto.
+I config SQLite vengono letti a pagine di ``batch_size`` righe.
+"""
+
+import os
+import threading
+
+from .cache import ConfigCache
+from .config import is_sqlite_config, iter_config_items
+from .trace import tracer
+
+LOAD_BATCH = 2000       # elementi consegnati per ogni blocco
+
+
+class ConfigLoad:
+    """
+    Lettura di un file di configurazione in un thread dedicato.
+
+    ``on_batch(load, items, progress)`` riceve ogni blocco di elementi con la
+    frazione di file letta (0–1); ``on_finish(load)`` viene chiamato alla fine,
+    anche in caso di errore (``load.error``) o annullamento. Entrambi sono
+    chiamati dal thread di caricamento.
+    """
+
+    def __init__(self, path: str, on_batch=None, on_finish=None, batch_size: int = LOAD_BATCH,
+                 cache: ConfigCache | None = None):
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self.meta: dict = {}        # chiavi di primo livello diverse da items, note a fine lettura
+        self.error: Exception | None = None
+        self.cached = False         # elementi presi dalla cache invece che dal file
+        self._cache = cache
+        self._on_batch = on_batch
+        self._on_finish = on_finish
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self):
+        threading.Thread(target=self._run, name="config-load", daemon=True).start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout=None) -> bool:
+        return self._done.wait(timeout)
+
+    def _run(self):
+        span = tracer.begin("load.parse", cat="load", path=self.path)
+        try:
+            # Stat preso prima di leggere: se il file cambia durante la lettura la voce in cache non vale
+            stat = os.stat(self.path)
+            hit = self._cache.get(self.path, stat) if self._cache is not None else None
+            if hit is not None:
+                self.cached = True
+                self._from_cache(*hit)
+            else:
+                self._parse(stat)
+        except Exception as e:
+            self.error = e
+        finally:
+            tracer.end(span, items=self.count, cancelled=self.cancelled, error=self.error is not None,
+                       cached=self.cached)
+            self._done.set()
+            if self._on_finish:
+                self._on_finish(self)
+
+    def _from_cache(self, items, meta):
+        self.meta.update(meta)
+        total = len(items)
+        for start in range(0, total, self.batch_size):
+            if self._cancel.is_set():
+                return
+            end = min(start + self.batch_size, total)
+            self._deliver(list(items[start:end]), end / total)
+
+    def _parse(self, stat: os.stat_result):
+        loaded = [] if self._cache is not None else None
+        batches = self._batches(stat)
+        try:
+            for batch, progress in batches:
+                if self._cancel.is_set():
+                    return
+                self._deliver(batch, progress)
+                if loaded is not None:
+                    loaded.extend(batch)
+        finally:
+            batches.close()
+        if loaded is not None and not self._cancel.is_set():
+            self._cache.put(self.path, loaded, self.meta, stat)
+
+    def _batches(self, stat: os.stat_result):
+        """Blocchi ``(elementi, frazione letta)`` dal file JSON o dal database."""
+        if is_sqlite_config(self.path):
+            from .sqlstore import iter_sql_pages
+
+            yield from iter_sql_pages(self.path, self.batch_size, meta=self.meta, stat=stat)
+            return
+        size = stat.st_size or 1
+        with open(self.path, "r", encoding="utf-8") as fp:
+            batch = []
+            for item in iter_config_items(fp, meta=self.meta):
+                if self._cancel.is_set():
+                    return
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    yield batch, min(fp.buffer.tell() / size, 1.0)
+                    batch = []
+        if batch:
+            yield batch, 1.0
+
+    def _deliver(self, batch, progress):
+        self.count += len(batch)
+        if self._on_batch:
+            self._on_batch(self, batch, progress)
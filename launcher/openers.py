@@ -0,0 +1,253 @@
+"""
+Backend per l'apertura di cartelle e URL.
+
+- ``startfile``: ``os.startfile`` (solo Windows)
+- ``spawn``:     un processo ``xdg-open`` / ``gio open`` / ``open`` per ogni cartella
+- ``helper``:    un processo di supporto persistente (vedi ``launcher.helper``) che
+                 riceve le cartelle da aprire e ammortizza l'avvio su tutti gli elementi
+- ``fake``:      non apre nulla e registra le chiamate, per test e benchmark
+
+Il backend si sceglie per config con ``"settings": {"opener": "<nome>"}``;
+senza indicazione, o se quello indicato non è disponibile sulla piattaforma
+(``resolve_opener``), si usa ``startfile`` su Windows e ``spawn`` altrove. La GUI
+propone solo i backend disponibili sulla piattaforma (``selectable_openers``).
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from .browser import open_urls
+from .config import get_setting
+
+SPAWN_WAIT = 5.0        # attesa massima dell'esito di xdg-open prima di considerarlo avviato
+
+
+def spawn_command() -> list[str] | None:
+    """Comando di sistema che apre una cartella nel file manager predefinito."""
+    if sys.platform == "darwin":
+        return ["open"]
+    if shutil.which("xdg-open"):
+        return ["xdg-open"]
+    if shutil.which("gio"):
+        return ["gio", "open"]
+    return None
+
+
+def _detached() -> dict:
+    kwargs = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS
+    else:
+        kwargs["start_new_session"] = True
+    return kwargs
+
+
+class Opener:
+    """Interfaccia comune dei backend di apertura."""
+
+    name = ""
+    selectable = True       # proposto tra le scelte della GUI
+
+    @classmethod
+    def available(cls) -> bool:
+        """Il backend può funzionare su questa piattaforma."""
+        return True
+
+    def open_folder(self, path: str):
+        raise NotImplementedError
+
+    def open_urls(self, urls: list[str]):
+        """Apre uno o più URL; con più URL il browser viene invocato una volta sola."""
+        open_urls(urls, batch_size=len(urls))
+
+    def close(self):
+        """Libera le risorse del backend (processi di supporto, ecc.)."""
+
+
+class StartfileOpener(Opener):
+    """Apertura tramite la shell di Windows."""
+
+    name = "startfile"
+
+    @classmethod
+    def available(cls) -> bool:
+        return hasattr(os, "startfile")
+
+    def open_folder(self, path: str):
+        if not hasattr(os, "startfile"):
+            raise OSError("L'apertura tramite la shell di Windows è disponibile solo su Windows")
+        os.startfile(path)
+
+
+class SpawnOpener(Opener):
+    """Un processo di sistema per ogni cartella (xdg-open, gio open, open)."""
+
+    name = "spawn"
+
+    @classmethod
+    def available(cls) -> bool:
+        return spawn_command() is not None
+
+    def __init__(self, command: list[str] | None = None):
+        self.command = command if command is not None else spawn_command()
+
+    def open_folder(self, path: str):
+        if not self.command:
+            raise OSError("Nessun comando disponibile per aprire le cartelle (xdg-open, gio)")
+        proc = subprocess.Popen(self.command + [path], **_detached())
+        try:
+            code = proc.wait(SPAWN_WAIT)
+        except subprocess.TimeoutExpired:
+            return  # ancora in esecuzione: il file manager è stato avviato in primo piano
+        if code != 0:
+            raise OSError(f"{self.command[0]} è terminato con codice {code}")
+
+
+class HelperOpener(Opener):
+    """
+    Processo di supporto persistente: viene avviato al primo uso e riceve le
+    cartelle una per riga (JSON) su stdin, rispondendo con l'esito su stdout.
+    Le richieste dei thread worker vengono serializzate.
+    """
+
+    name = "helper"
+
+    @classmethod
+    def available(cls) -> bool:
+        # Il processo di supporto usa os.startfile oppure lo stesso comando di spawn
+        return hasattr(os, "startfile") or spawn_command() is not None
+
+    def __init__(self, command: list[str] | None = None):
+        self.command = command or [sys.executable, "-m", "launcher.helper"]
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            env = dict(os.environ)
+            package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_parent, env.get("PYTHONPATH")]))
+            self._proc = subprocess.Popen(
+                self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, encoding="utf-8", bufsize=1, env=env,
+            )
+        return self._proc
+
+    def open_folder(self, path: str):
+        with self._lock:
+            proc = self._ensure()
+            try:
+                proc.stdin.write(json.dumps({"path": path}) + "\n")
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+            except (OSError, ValueError):
+                line = ""
+            if not line:
+                self._proc = None
+                proc.kill()
+                raise OSError("Il processo di supporto è terminato")
+        reply = json.loads(line)
+        if not reply.get("ok"):
+            raise OSError(reply.get("error", "errore sconosciuto"))
+
+    def close(self):
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+
+class FakeOpener(Opener):
+    """Registra le aperture senza eseguirle; ``delay`` simula la durata di ognuna."""
+
+    name = "fake"
+    selectable = False      # solo per test e benchmark
+
+    def __init__(self, delay: float = 0.0, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.opened: list[str] = []
+        self.invocations = 0
+        self._lock = threading.Lock()
+
+    def _open(self, targets: list[str]):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.invocations += 1
+            self.opened.extend(targets)
+        for target in targets:
+            if target in self.fail:
+                raise OSError(f"Apertura simulata fallita: {target}")
+
+    def open_folder(self, path: str):
+        self._open([path])
+
+    def open_urls(self, urls: list[str]):
+        self._open(list(urls))
+
+
+OPENERS = {
+    "startfile": StartfileOpener,
+    "spawn": SpawnOpener,
+    "helper": HelperOpener,
+    "fake": FakeOpener,
+}
+
+_instances: dict[str, Opener] = {}
+_instances_lock = threading.Lock()
+
+
+def selectable_openers() -> list[str]:
+    """Backend da proporre all'utente: disponibili qui ed esclusi quelli di test."""
+    return [name for name, cls in OPENERS.items() if cls.selectable and cls.available()]
+
+
+def default_opener_name() -> str:
+    return "startfile" if sys.platform == "win32" else "spawn"
+
+
+def get_opener(name: str | None = None) -> Opener:
+    """
+    Backend con il nome indicato (o quello predefinito per la piattaforma).
+    Le istanze vengono riutilizzate, così il processo di supporto resta attivo
+    tra un lancio e l'altro.
+    """
+    name = name or default_opener_name()
+    if name not in OPENERS:
+        raise ValueError(f"Backend di apertura sconosciuto: {name}")
+    with _instances_lock:
+        opener = _instances.get(name)
+        if opener is None:
+            opener = _instances[name] = OPENERS[name]()
+    return opener
+
+
+def resolve_opener(meta: dict) -> Opener:
+    """
+    Backend scelto in ``settings.opener`` di un config; quello di sistema se
+    assente, sconosciuto o non utilizzabile qui (es. un config salvato su Windows).
+    """
+    name = get_setting(meta, "opener")
+    if name not in OPENERS or not OPENERS[name].available():
+        return get_opener()
+    return get_opener(name)
+
+
+def close_openers():
+    """Chiude tutti i backend creati da ``get_opener``."""
+    with _instances_lock:
+        openers = list(_instances.values())
+        _instances.clear()
+    for opener in openers:
+        opener.close()
@@ -0,0 +1,171 @@
+"""
+Salvataggio in background dei file di configurazione.
+
+Le richieste ravvicinate verso lo stesso file vengono accorpate (debounce):
+viene scritta solo l'ultima versione, in modo atomico, da un thread dedicato.
+"""
+
+import threading
+import time
+
+from .config import write_config
+from .trace import tracer
+
+SAVE_DELAY = 0.3        # secondi di quiete prima di scrivere
+SAVE_MAX_DELAY = 2.0    # attesa massima anche con modifiche continue
+
+
+class _Pending:
+    __slots__ = ("items", "meta", "first", "last", "forced")
+
+    def __init__(self, items, meta, now):
+        self.items = items
+        self.meta = meta
+        self.first = now
+        self.last = now
+        self.forced = False
+
+
+class ConfigSaver:
+    """
+    Coda di salvataggio write-behind.
+
+    ``save()`` registra una copia della lista e ritorna subito; il thread di
+    scrittura attende ``delay`` secondi senza nuove richieste (al massimo
+    ``max_delay``) e scrive l'ultima versione. Gli errori vengono passati a
+    ``on_error(path, exc)``, le scritture riuscite a ``on_saved(path, items,
+    meta, result)`` con il valore restituito da ``writer``; entrambi sono
+    chiamati dal thread di scrittura.
+    """
+
+    def __init__(self, delay: float = SAVE_DELAY, max_delay: float = SAVE_MAX_DELAY,
+                 fsync: bool = False, on_error=None, writer=write_config, on_saved=None):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.fsync = fsync
+        self._on_error = on_error
+        self._on_saved = on_saved
+        self._writer = writer
+        self._cond = threading.Condition()
+        self._pending: dict[str, _Pending] = {}
+        self._writing = 0
+        self._closed = False
+        self._thread = None
+        # Statistiche
+        self.writes = 0
+        self.coalesced = 0          # salvataggi saltati perché sostituiti da uno più recente
+        self.errors = 0
+        self.last_latency = 0.0     # dalla prima richiesta al file scritto
+        self.last_write_time = 0.0  # durata della sola scrittura
+        self.max_latency = 0.0
+
+    def save(self, path: str, items, meta: dict | None = None):
+        """Pianifica il salvataggio di ``items`` (e delle chiavi ``meta``) in ``path``."""
+        snapshot = list(items)
+        meta = dict(meta) if meta else None
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ConfigSaver chiuso")
+            pending = self._pending.get(path)
+            if pending is None:
+                self._pending[path] = _Pending(snapshot, meta, now)
+            else:
+                pending.items = snapshot
+                pending.meta = meta
+                pending.last = now
+                self.coalesced += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="config-saver", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    @property
+    def pending(self) -> bool:
+        with self._cond:
+            return bool(self._pending) or self._writing > 0
+
+    def flush(self, timeout=None) -> bool:
+        """Scrive subito i salvataggi in attesa e aspetta che siano completati."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            for pending in self._pending.values():
+                pending.forced = True
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout=None) -> bool:
+        """Completa i salvataggi in attesa e ferma il thread di scrittura."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return flushed
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "pending": len(self._pending),
+                "last_latency": self.last_latency,
+                "last_write_time": self.last_write_time,
+                "max_latency": self.max_latency,
+            }
+
+    def _due(self, pending: _Pending) -> float:
+        if pending.forced:
+            return pending.first
+        return min(pending.last + self.delay, pending.first + self.max_delay)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed and not self._pending:
+                        return
+                    now = time.monotonic()
+                    ready = [p for p, pend in self._pending.items() if self._due(pend) <= now]
+                    if ready:
+                        break
+                    wait = min((self._due(p) for p in self._pending.values()), default=None)
+                    self._cond.wait(None if wait is None else wait - now)
+                jobs = [(path, self._pending.pop(path)) for path in ready]
+                self._writing += len(jobs)
+
+            for path, pending in jobs:
+                t0 = time.monotonic()
+                p0 = time.perf_counter()
+                try:
+                    result = self._writer(path, pending.items, fsync=self.fsync, meta=pending.meta)
+                    error = None
+                except Exception as e:
+                    error = e
+                t1 = time.monotonic()
+                tracer.add("save.write", p0, time.perf_counter() - p0, cat="save",
+                           path=path, items=len(pending.items), ok=error is None)
+                if error is None and self._on_saved:
+                    # Prima di azzerare _writing: finché pending è vero la notifica non è ancora arrivata
+                    self._on_saved(path, pending.items, pending.meta, result)
+                with self._cond:
+                    self._writing -= 1
+                    if error is None:
+                        self.writes += 1
+                        self.last_write_time = t1 - t0
+                        latency = t1 - pending.first
+                        self.last_latency = latency
+                        self.max_latency = max(self.max_latency, latency)
+                    else:
+                        self.errors += 1
+                    self._cond.notify_all()
+                if error is not None and self._on_error:
+                    self._on_error(path, error)
@@ -0,0 +1,180 @@
+"""
+Verifica preliminare (pre-flight) delle cartelle configurate.
+
+Le cartelle vengono controllate in parallelo, ognuna con un proprio timeout:
+un percorso di rete irraggiungibile viene segnalato come lento invece di
+bloccare gli altri. Gli esiti finiscono in una cache con scadenza (TTL), così
+lanci ripetuti e la lista non devono rifare ``stat`` a ogni volta.
+
+La funzione di controllo (``isdir``) e l'orologio sono iniettabili, per poter
+simulare un filesystem lento.
+"""
+
+import os
+import queue
+import threading
+import time
+
+from .trace import tracer
+
+OK = "ok"
+MISSING = "missing"
+SLOW = "slow"
+
+PREFLIGHT_TIMEOUT = 2.0     # secondi oltre i quali un percorso è considerato lento
+PREFLIGHT_TTL = 30.0        # validità degli esiti in cache
+PREFLIGHT_WORKERS = 8
+
+
+def share_root(path: str) -> str | None:
+    """Radice di condivisione di un percorso di rete (\\\\server\\share), altrimenti None."""
+    drive = os.path.splitdrive(path)[0]
+    if drive[:2] in ("\\\\", "//"):
+        return drive.lower()
+    return None
+
+
+class ExistenceCache:
+    """Esiti delle verifiche per percorso, con scadenza. Thread-safe."""
+
+    def __init__(self, ttl: float = PREFLIGHT_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[str, float]] = {}    # percorso -> (esito, scadenza)
+
+    def get(self, path: str) -> str | None:
+        """Esito ancora valido per il percorso, o None se assente o scaduto."""
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None or entry[1] <= self._clock():
+            return None
+        return entry[0]
+
+    def last(self, path: str) -> str | None:
+        """Ultimo esito noto, anche se scaduto (usato per marcare la lista)."""
+        with self._lock:
+            entry = self._entries.get(path)
+        return entry[0] if entry else None
+
+    def put(self, path: str, status: str):
+        with self._lock:
+            self._entries[path] = (status, self._clock() + self.ttl)
+
+    def invalidate(self, path: str | None = None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class Preflight:
+    """Controllo parallelo dell'esistenza di un insieme di cartelle."""
+
+    def __init__(self, cache: ExistenceCache | None = None, timeout: float = PREFLIGHT_TIMEOUT,
+                 workers: int = PREFLIGHT_WORKERS, isdir=os.path.isdir, clock=time.monotonic):
+        self.cache = cache if cache is not None else ExistenceCache(clock=clock)
+        self.timeout = timeout
+        self.workers = workers
+        self._isdir = isdir
+        self._clock = clock
+
+    def check(self, paths, on_result=None, cancel: threading.Event | None = None) -> dict[str, str]:
+        """
+        Verifica i percorsi e restituisce ``{percorso: esito}``.
+
+        Blocca il thread chiamante per al massimo ``timeout`` secondi oltre il
+        tempo necessario ai controlli veloci; ``on_result(path, status)`` viene
+        chiamato da questo stesso thread man mano che gli esiti sono noti.
+        """
+        with tracer.span("preflight.check", cat="preflight") as span:
+            results = self._check(paths, on_result, cancel)
+            span.args = {"paths": len(results)}
+        return results
+
+    def _check(self, paths, on_result, cancel) -> dict[str, str]:
+        results: dict[str, str] = {}
+
+        def report(path, status):
+            results[path] = status
+            if on_result:
+                on_result(path, status)
+
+        todo: queue.SimpleQueue = queue.SimpleQueue()
+        pending = 0
+        for path in dict.fromkeys(paths):
+            status = self.cache.get(path)
+            if status is not None:
+                report(path, status)
+            else:
+                todo.put(path)
+                pending += 1
+        if not pending:
+            return results
+
+        done: queue.SimpleQueue = queue.SimpleQueue()
+        lock = threading.Lock()
+        inflight: dict[str, float] = {}     # percorso -> inizio del controllo
+        slow_roots: set[str] = set()
+
+        def worker():
+            while True:
+                try:
+                    path = todo.get_nowait()
+                except queue.Empty:
+                    return
+                root = share_root(path)
+                with lock:
+                    skip = root is not None and root in slow_roots
+                    if not skip:
+                        inflight[path] = self._clock()
+                if skip:
+                    # Stessa condivisione di rete di un percorso già lento: inutile aspettare di nuovo
+                    done.put((path, SLOW))
+                    continue
+                try:
+                    status = OK if self._isdir(path) else MISSING
+                except OSError:
+                    status = MISSING
+                # Anche un esito arrivato dopo il timeout aggiorna la cache
+                self.cache.put(path, status)
+                with lock:
+                    inflight.pop(path, None)
+                done.put((path, status))
+
+        def spawn():
+            threading.Thread(target=worker, name="preflight", daemon=True).start()
+
+        for _ in range(min(self.workers, pending)):
+            spawn()
+
+        poll = min(self.timeout / 4, 0.05)
+        while pending:
+            if cancel is not None and cancel.is_set():
+                break
+            try:
+                path, status = done.get(timeout=poll)
+            except queue.Empty:
+                pass
+            else:
+                if path not in results:
+                    report(path, status)
+                    pending -= 1
+            now = self._clock()
+            with lock:
+                expired = [p for p, t0 in inflight.items() if now - t0 >= self.timeout and p not in results]
+                for path in expired:
+                    root = share_root(path)
+                    if root is not None:
+                        slow_roots.add(root)
+            for path in expired:
+                self.cache.put(path, SLOW)
+                report(path, SLOW)
+                pending -= 1
+                # Il worker resta bloccato sul percorso lento: ne avvia un altro al suo posto
+                spawn()
+        return results
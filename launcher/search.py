@@ -0,0 +1,305 @@
+"""
+Ricerca incrementale sugli elementi configurati.
+
+Il testo cercato è ``nome``, ``percorso`` e ``tipo`` in minuscolo. L'indice
+associa ogni trigramma del testo agli elementi che lo contengono, e ogni
+prefisso di una o due lettere delle parole agli elementi con una parola che
+inizia così: una ricerca legge solo la lista più corta tra quelle dei suoi
+termini invece di scorrere tutta la lista. Aggiunte e rimozioni aggiornano
+l'indice sul posto; la costruzione iniziale avviene in un thread.
+
+Termini di tre o più caratteri cercano una sottostringa, quelli più corti
+l'inizio di una parola; più termini separati da spazi devono esserci tutti.
+"""
+
+import re
+import threading
+
+from .trace import tracer
+
+BUILD_CHUNK = 200       # elementi (o liste, per la compattazione) elaborati per volta in background
+_WORD = re.compile(r"\w+")
+
+
+def item_text(item) -> str:
+    """Testo su cui si cerca: nome, percorso e tipo in minuscolo."""
+    return f"{item.name}\n{item.path}\n{item.type}".casefold()
+
+
+def _keys(text: str) -> set[str]:
+    keys = {text[i:i + 3] for i in range(len(text) - 2)}
+    for word in _WORD.findall(text):
+        keys.add(word[:1])
+        keys.add(word[:2])
+    return keys
+
+
+def _has_term(text: str, term: str) -> bool:
+    if len(term) >= 3:
+        return term in text
+    return any(word.startswith(term) for word in _WORD.findall(text))
+
+
+def split_query(query: str) -> list[str]:
+    return query.casefold().split()
+
+
+def refines(query: str, previous: str) -> bool:
+    """
+    Ogni risultato di ``query`` è anche un risultato di ``previous`` (es. si è
+    aggiunto un carattere): basta filtrare i risultati precedenti.
+    """
+    old, new = split_query(previous), split_query(query)
+    if not old or len(new) < len(old):
+        return False
+    # Passando da 2 a 3 caratteri un termine cambia significato (da inizio parola a sottostringa)
+    return all(n.startswith(o) and (len(o) >= 3 or len(n) < 3) for o, n in zip(old, new))
+
+
+class SearchIndex:
+    """
+    Indice per trigrammi e prefissi degli elementi di una lista.
+
+    Le liste dell'indice seguono l'ordine in cui gli elementi sono stati
+    indicizzati: finché coincide con quello della lista (costruzione completa,
+    poi solo aggiunte in coda) i risultati non vanno riordinati.
+
+    Le rimozioni non toccano le liste dell'indice: un elemento rimosso viene
+    solo tolto dagli elementi vivi e scartato quando compare tra i candidati.
+    Quando i rimossi diventano troppi le liste vengono ripulite in background,
+    senza cambiarne l'ordine.
+    Tutti i metodi sono thread-safe.
+    """
+
+    def __init__(self, chunk: int = BUILD_CHUNK):
+        self.chunk = chunk
+        self._lock = threading.Lock()
+        self._texts: dict = {}              # elemento vivo e indicizzato -> testo
+        self._postings: dict[str, list] = {}
+        self._alive: set = set()            # elementi della lista (indicizzati o in attesa)
+        self._removed: set = set()          # elementi tolti i cui riferimenti restano nelle liste
+        self._late: list = []               # aggiunti durante la costruzione, indicizzati alla fine
+        self._ordered = True                # l'ordine delle liste è quello della lista
+        self._generation = 0
+        self._building = False
+        self._compacting = False
+        self._complete = False              # l'indice copre tutta la lista
+        self._built = threading.Event()
+        self.active = False                 # False finché l'indice non è mai stato richiesto
+
+    @property
+    def ready(self) -> bool:
+        """Tutti gli elementi della lista sono indicizzati."""
+        return self._complete
+
+    @property
+    def stale(self) -> bool:
+        """L'indice non copre la lista e nessuna costruzione è in corso: serve ``build()``."""
+        return not self._complete and not self._building
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def wait(self, timeout=None) -> bool:
+        """Attende la fine della costruzione avviata con ``build()``."""
+        return self._built.wait(timeout)
+
+    # ── Maintenance ──────────────────────────────────────────────────────────
+
+    def build(self, items):
+        """(Ri)costruisce l'indice per ``items`` in un thread; le ricerche restano possibili."""
+        items = list(items)
+        with self._lock:
+            self.active = True
+            self._reset()
+            self._alive = set(items)
+            self._building = True
+            generation = self._generation
+        threading.Thread(target=self._build, args=(items, generation),
+                         name="search-index", daemon=True).start()
+
+    def _build(self, items, generation: int):
+        with tracer.span("search.build", cat="search", items=len(items)):
+            for start in range(0, len(items), self.chunk):
+                with self._lock:
+                    if generation != self._generation:
+                        return
+                    for item in items[start:start + self.chunk]:
+                        if item in self._alive and item not in self._texts:
+                            self._index(item)
+            with self._lock:
+                if generation != self._generation:
+                    return
+                for item in self._late:
+                    if item in self._alive and item not in self._texts:
+                        self._index(item)
+                self._late = []
+                self._building = False
+                self._complete = True
+                self._built.set()
+
+    def add(self, items, at_end: bool = True):
+        """
+        Indicizza elementi aggiunti alla lista (nessun effetto se l'indice non è
+        attivo). ``at_end`` è False se non sono stati aggiunti in coda.
+        """
+        if not self.active:
+            return
+        with self._lock:
+            for item in items:
+                self._alive.add(item)
+                if item in self._removed or self._compacting:
+                    self._ordered = False   # i vecchi riferimenti sono fuori posto
+                if self._building:
+                    self._late.append(item)
+                elif item not in self._texts:
+                    self._index(item)
+            if not at_end:
+                self._ordered = False
+
+    def remove(self, items):
+        if not self.active:
+            return
+        with self._lock:
+            for item in items:
+                self._alive.discard(item)
+                if self._texts.pop(item, None) is not None:
+                    self._removed.add(item)
+            if self._building or self._compacting or len(self._removed) <= max(len(self._alive), 1000):
+                return
+            self._compacting = True
+            self._removed = set()
+            generation = self._generation
+        threading.Thread(target=self._compact, args=(generation,),
+                         name="search-compact", daemon=True).start()
+
+    def _compact(self, generation: int):
+        """Toglie dalle liste dell'indice i riferimenti agli elementi rimossi."""
+        with tracer.span("search.compact", cat="search"):
+            with self._lock:
+                keys = list(self._postings)
+            for start in range(0, len(keys), self.chunk):
+                with self._lock:
+                    if generation != self._generation:
+                        return
+                    postings, texts = self._postings, self._texts
+                    for key in keys[start:start + self.chunk]:
+                        bucket = postings.get(key)
+                        if bucket is None:
+                            continue
+                        bucket[:] = [item for item in bucket if item in texts]
+                        if not bucket:
+                            del postings[key]
+            with self._lock:
+                if generation == self._generation:
+                    self._compacting = False
+
+    def clear(self):
+        """Svuota l'indice: fino al prossimo ``build()`` le ricerche scorrono la lista."""
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self._generation += 1
+        self._texts = {}
+        self._postings = {}
+        self._alive = set()
+        self._removed = set()
+        self._late = []
+        self._ordered = True
+        self._building = False
+        self._compacting = False
+        self._complete = False
+        self._built = threading.Event()
+
+    def _index(self, item):
+        text = item_text(item)
+        self._texts[item] = text
+        postings = self._postings
+        for key in _keys(text):
+            bucket = postings.get(key)
+            if bucket is None:
+                postings[key] = [item]
+            else:
+                bucket.append(item)
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def search(self, query: str, items, within=None) -> list:
+        """
+        Elementi di ``items`` che corrispondono a ``query``, nell'ordine della lista.
+
+        ``within`` sono i risultati di una ricerca precedente di cui questa è un
+        raffinamento (es. un carattere in più): basta filtrare quelli.
+        """
+        terms = split_query(query)
+        if not terms:
+            return list(items)
+        with tracer.span("search.query", cat="search") as span:
+            with self._lock:
+                if not self._complete:
+                    # Indice in costruzione: scansione completa, come prima che esistesse
+                    found = self._scan(within if within is not None else items, terms)
+                elif within is not None:
+                    found = within
+                    for term in terms:
+                        found = self._filter(found, term)
+                else:
+                    found = self._lookup(terms, items)
+            span.args = {"query": query, "matches": len(found), "indexed": self._complete}
+        return found
+
+    def _lookup(self, terms: list[str], items) -> list:
+        # Candidati dal termine più selettivo, poi un filtro per ciascuno degli altri
+        terms = sorted(terms, key=lambda term: len(self._bucket(term)))
+        found = self._candidates(terms[0])
+        for term in terms[1:]:
+            if not found:
+                break
+            found = self._filter(found, term)
+        if self._ordered or not found:
+            return found
+        matched = set(found)
+        return [item for item in items if item in matched]
+
+    def _candidates(self, term: str) -> list:
+        bucket = self._bucket(term)
+        texts = self._texts
+        if len(term) > 3:
+            return [item for item in bucket if term in texts.get(item, "")]
+        # Prefisso o trigramma: la lista dell'indice è già esatta, restano da togliere i rimossi
+        # (anche quelli che la compattazione in corso non ha ancora raggiunto)
+        if self._removed or self._compacting:
+            return [item for item in bucket if item in texts]
+        return list(bucket)
+
+    def _filter(self, found: list, term: str) -> list:
+        if len(term) < 3:
+            prefixed = set(self._postings.get(term, ()))
+            return [item for item in found if item in prefixed]
+        texts = self._texts
+        return [item for item in found if term in texts.get(item, "")]
+
+    def _bucket(self, term: str) -> list:
+        """Lista dell'indice più corta che contiene tutti i candidati per ``term``."""
+        postings = self._postings
+        if len(term) < 3:
+            return postings.get(term, [])
+        shortest = None
+        for i in range(len(term) - 2):
+            bucket = postings.get(term[i:i + 3])
+            if bucket is None:
+                return []
+            if shortest is None or len(bucket) < len(shortest):
+                shortest = bucket
+        return shortest
+
+    def _scan(self, items, terms: list[str]) -> list:
+        texts = self._texts
+        return [item for item in items
+                if all(_has_term(texts.get(item) or item_text(item), term) for term in terms)]
+
+    def matches(self, item, query: str) -> bool:
+        """Un singolo elemento corrisponde a ``query``."""
+        text = item_text(item)
+        return all(_has_term(text, term) for term in split_query(query))
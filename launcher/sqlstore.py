@@ -0,0 +1,274 @@
+"""
+Config in formato SQLite, alternativo al JSON per liste molto grandi.
+
+Un file ``.sqlite`` / ``.sqlite3`` / ``.db`` contiene una riga per elemento,
+con indici su posizione, percorso, tipo e nome, e una riga per ogni chiave di
+primo livello del config (``settings`` ecc., valori in JSON). Salvare non
+riscrive il file: si confronta la lista con l'ultima versione scritta o letta
+e si aggiornano solo le righe cambiate, quindi aggiungere o togliere un elemento
+è una sola scrittura. Le righe si ricordano solo per l'ultimo config usato
+(``MIRROR_ENTRIES``): per gli altri il salvataggio rilegge prima il database.
+La lettura avviene a pagine, in ordine di posizione.
+
+Import ed export sono senza perdite: i campi sconosciuti degli elementi
+(``extra``) e le altre chiavi di primo livello vengono conservati in JSON.
+"""
+
+import contextlib
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+
+from .items import Item, ItemStore, changed_range, same_item
+
+PAGE_SIZE = 2000        # righe lette per ogni pagina
+MIRROR_ENTRIES = 1      # config di cui si ricordano le righe: di norma solo quello aperto
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id    INTEGER PRIMARY KEY,
+    pos   REAL NOT NULL,
+    name  TEXT NOT NULL,
+    path  TEXT NOT NULL,
+    type  TEXT NOT NULL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS items_pos ON items(pos);
+CREATE INDEX IF NOT EXISTS items_path ON items(path);
+CREATE INDEX IF NOT EXISTS items_type ON items(type);
+CREATE INDEX IF NOT EXISTS items_name ON items(name);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_TABLES = {"items", "meta"}
+_MIN_GAP = 1e-6     # distanza minima tra due posizioni prima di rinumerare
+_MISSING = object()
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int]:
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Mirror:
+    """Ultima versione nota del database: righe (id, pos) allineate agli elementi."""
+
+    __slots__ = ("ids", "positions", "items", "meta", "signature")
+
+    def __init__(self, ids: list[int], positions: list[float], items: list[Item], meta: dict,
+                 signature=None):
+        self.ids = ids
+        self.positions = positions
+        self.items = items
+        self.meta = meta
+        self.signature = signature
+
+
+_mirrors: dict[str, _Mirror] = {}     # in ordine di uso, il più recente in fondo
+_mirrors_lock = threading.Lock()
+
+
+def _key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _remember(key: str, mirror: _Mirror):
+    """Ricorda le righe di un config, scartando quelle dei config usati meno di recente."""
+    with _mirrors_lock:
+        _mirrors.pop(key, None)
+        _mirrors[key] = mirror
+        while len(_mirrors) > MIRROR_ENTRIES:
+            del _mirrors[next(iter(_mirrors))]
+
+
+@contextlib.contextmanager
+def _connect(path: str, create: bool = False):
+    """
+    Connessione al config; gli errori di SQLite diventano ValueError come per il JSON.
+
+    In lettura il file è aperto in sola lettura e deve contenere le tabelle del
+    config. Con ``create`` le tabelle vengono create, ma solo in un database
+    nuovo o vuoto: un database di altri programmi non viene toccato.
+    """
+    if not create and not os.path.exists(path):
+        raise FileNotFoundError(f"File non trovato: {path}")
+    try:
+        if create:
+            conn = sqlite3.connect(path, check_same_thread=False)
+        else:
+            uri = pathlib.Path(os.path.abspath(path)).as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    except sqlite3.Error as e:
+        raise OSError(f"Impossibile aprire il database: {e}") from e
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if not _TABLES <= tables:
+            if not create or (tables and "items" not in tables):
+                raise ValueError(f"{os.path.basename(path)} non è un config di Window Launcher")
+            conn.executescript(_SCHEMA)
+        yield conn
+    except sqlite3.DatabaseError as e:
+        raise ValueError(f"Database non valido: {e}") from e
+    finally:
+        conn.close()
+
+
+def _row_item(name: str, path: str, type: str, extra: str | None) -> Item:
+    return Item(name, path, type, json.loads(extra) if extra else None)
+
+
+def _item_row(item: Item) -> tuple:
+    extra = json.dumps(item.extra, ensure_ascii=False, separators=(",", ":")) if item.extra else None
+    return item.name, item.path, item.type, extra
+
+
+def _copy_meta(meta: dict) -> dict:
+    """Copia profonda: la GUI modifica ``meta`` sul posto (es. ``settings``)."""
+    return json.loads(json.dumps(meta))
+
+
+def _read_meta(conn) -> dict:
+    return {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM meta")}
+
+
+def iter_sql_pages(path: str, page_size: int = PAGE_SIZE, meta: dict | None = None,
+                   stat: os.stat_result | None = None):
+    """
+    Restituisce ``(elementi, frazione letta)`` una pagina alla volta.
+
+    Le pagine sono lette in un'unica transazione, quindi sono coerenti anche se
+    il file viene scritto nel frattempo. ``meta`` riceve le altre chiavi di
+    primo livello. Se la lettura arriva in fondo, le righe vengono ricordate
+    per i salvataggi successivi (``stat`` è quello preso prima di leggere).
+    """
+    if meta is None:
+        meta = {}
+    with _connect(path) as conn:
+        conn.execute("BEGIN")
+        meta.update(_read_meta(conn))
+        total = conn.execute("SELECT count(*) FROM items").fetchone()[0] or 1
+        ids: list[int] = []
+        positions: list[float] = []
+        items: list[Item] = []
+        last = float("-inf")
+        while True:
+            rows = conn.execute(
+                "SELECT id, pos, name, path, type, extra FROM items WHERE pos > ? ORDER BY pos LIMIT ?",
+                (last, page_size)).fetchall()
+            if not rows:
+                break
+            page = [_row_item(*row[2:]) for row in rows]
+            ids.extend(row[0] for row in rows)
+            positions.extend(row[1] for row in rows)
+            items.extend(page)
+            last = rows[-1][1]
+            yield page, min(len(items) / total, 1.0)
+        conn.rollback()
+    _remember(_key(path), _Mirror(ids, positions, items, _copy_meta(meta),
+                                  _signature(stat) if stat is not None else None))
+
+
+def load_sql_config(path: str) -> ItemStore:
+    """Legge tutto il config SQLite; solleva OSError/ValueError in caso di errore."""
+    store = ItemStore()
+    for page, _ in iter_sql_pages(path, meta=store.meta):
+        store.extend(page)
+    return store
+
+
+def _load_mirror(conn) -> _Mirror:
+    ids, positions, items = [], [], []
+    for row in conn.execute("SELECT id, pos, name, path, type, extra FROM items ORDER BY pos"):
+        ids.append(row[0])
+        positions.append(row[1])
+        items.append(_row_item(*row[2:]))
+    return _Mirror(ids, positions, items, _read_meta(conn))
+
+
+def _renumber(conn, mirror: _Mirror):
+    """Posizioni troppo vicine per inserire tra loro: tornano 1, 2, 3…"""
+    mirror.positions = [float(i + 1) for i in range(len(mirror.ids))]
+    conn.executemany("UPDATE items SET pos = ? WHERE id = ?", zip(mirror.positions, mirror.ids))
+
+
+def _apply_items(conn, mirror: _Mirror, items: list[Item]):
+    start, old_end, new_end = changed_range(mirror.items, items)
+    if old_end - start == new_end - start:
+        # Stessa lunghezza: le righe esistenti vengono aggiornate al loro posto
+        changed = [(*_item_row(items[i]), mirror.ids[i]) for i in range(start, old_end)
+                   if not same_item(items[i], mirror.items[i])]
+        conn.executemany("UPDATE items SET name = ?, path = ?, type = ?, extra = ? WHERE id = ?", changed)
+        mirror.items[start:old_end] = items[start:new_end]
+        return
+    if old_end > start:
+        conn.executemany("DELETE FROM items WHERE id = ?", ((i,) for i in mirror.ids[start:old_end]))
+        del mirror.ids[start:old_end]
+        del mirror.positions[start:old_end]
+        del mirror.items[start:old_end]
+    added = items[start:new_end]
+    if not added:
+        return
+    lo = mirror.positions[start - 1] if start > 0 else 0.0
+    hi = mirror.positions[start] if start < len(mirror.positions) else lo + len(added) + 1
+    step = (hi - lo) / (len(added) + 1)
+    if step < _MIN_GAP:
+        _renumber(conn, mirror)
+        lo = mirror.positions[start - 1] if start > 0 else 0.0
+        hi = mirror.positions[start] if start < len(mirror.positions) else lo + len(added) + 1
+        if start < len(mirror.positions):
+            # Spazio per i nuovi elementi: sposta in avanti le righe che seguono
+            shift = len(added) + 1
+            mirror.positions[start:] = [p + shift for p in mirror.positions[start:]]
+            conn.executemany("UPDATE items SET pos = ? WHERE id = ?",
+                             zip(mirror.positions[start:], mirror.ids[start:]))
+            hi += shift
+        step = (hi - lo) / (len(added) + 1)
+    positions = [lo + step * n for n in range(1, len(added) + 1)]
+    conn.executemany("INSERT INTO items (pos, name, path, type, extra) VALUES (?, ?, ?, ?, ?)",
+                     ((pos, *_item_row(item)) for pos, item in zip(positions, added)))
+    # Gli id assegnati, nello stesso ordine: nessun'altra riga cade tra lo e hi
+    ids = [row[0] for row in conn.execute(
+        "SELECT id FROM items WHERE pos > ? AND pos < ? ORDER BY pos", (lo, hi))]
+    mirror.ids[start:start] = ids
+    mirror.positions[start:start] = positions
+    mirror.items[start:start] = added
+
+
+def _apply_meta(conn, mirror: _Mirror, meta: dict):
+    meta = {k: v for k, v in meta.items() if k != "items"}
+    removed = [(key,) for key in mirror.meta if key not in meta]
+    changed = [(key, json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+               for key, value in meta.items() if mirror.meta.get(key, _MISSING) != value]
+    conn.executemany("DELETE FROM meta WHERE key = ?", removed)
+    conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", changed)
+    mirror.meta = _copy_meta(meta)
+
+
+def write_sql_config(path: str, items, fsync: bool = False, meta: dict | None = None) -> os.stat_result:
+    """
+    Porta il database allo stato di ``items`` / ``meta`` scrivendo solo le righe
+    cambiate, in una transazione. Restituisce lo stat del file scritto.
+    """
+    items = list(items)
+    key = _key(path)
+    with _mirrors_lock:
+        mirror = _mirrors.pop(key, None)
+    with _connect(path, create=True) as conn:
+        conn.execute(f"PRAGMA synchronous = {'FULL' if fsync else 'NORMAL'}")
+        try:
+            current = _signature(os.stat(path))
+        except OSError:
+            current = None
+        if mirror is None or mirror.signature != current:
+            mirror = _load_mirror(conn)     # file cambiato da altri: si riparte dal contenuto attuale
+        with conn:
+            _apply_items(conn, mirror, items)
+            _apply_meta(conn, mirror, meta or {})
+    stat = os.stat(path)
+    mirror.signature = _signature(stat)
+    _remember(key, mirror)
+    return stat
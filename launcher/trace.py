@@ -0,0 +1,141 @@
+"""
+Strumentazione: span temporali con timestamp monotoni.
+
+Ogni parte dell'applicazione registra le proprie durate nel ``tracer`` globale
+(avvio, lettura, lista, salvataggio, lancio dei singoli elementi). Le span
+restano in memoria (al massimo ``TRACE_LIMIT``) e possono essere esportate in
+JSON oppure nel formato Chrome trace (chrome://tracing, Perfetto) con
+``--trace FILE`` o la variabile d'ambiente ``WINDOW_LAUNCHER_TRACE``.
+"""
+
+import collections
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+TRACE_ENV = "WINDOW_LAUNCHER_TRACE"                 # file in cui scrivere la trace all'uscita
+TRACE_FORMAT_ENV = "WINDOW_LAUNCHER_TRACE_FORMAT"   # "chrome" (default) o "json"
+TRACE_FORMATS = ("chrome", "json")
+TRACE_LIMIT = 200_000                               # span massime conservate
+
+
+class Span:
+    """Intervallo di tempo misurato; ``start`` è un ``time.perf_counter()``."""
+
+    __slots__ = ("name", "cat", "start", "duration", "thread", "args")
+
+    def __init__(self, name: str, cat: str, start: float, duration: float = 0.0,
+                 thread: int = 0, args: dict | None = None):
+        self.name = name
+        self.cat = cat
+        self.start = start
+        self.duration = duration
+        self.thread = thread
+        self.args = args
+
+    def to_dict(self, origin: float) -> dict:
+        data = {"name": self.name, "cat": self.cat,
+                "start": self.start - origin, "duration": self.duration, "thread": self.thread}
+        if self.args:
+            data["args"] = self.args
+        return data
+
+
+class Tracer:
+    """Raccolta thread-safe delle span dell'applicazione."""
+
+    def __init__(self, limit: int = TRACE_LIMIT):
+        self.origin = time.perf_counter()
+        self._spans: collections.deque[Span] = collections.deque(maxlen=limit)
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, duration: float, cat: str = "app", **args):
+        """Registra una span già misurata altrove."""
+        span = Span(name, cat, start, duration, threading.get_ident(), args or None)
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def begin(self, name: str, cat: str = "app", **args) -> Span:
+        """Apre una span da chiudere con ``end()`` (anche da un altro callback)."""
+        return Span(name, cat, time.perf_counter(), 0.0, threading.get_ident(), args or None)
+
+    def end(self, span: Span, **args) -> Span:
+        span.duration = time.perf_counter() - span.start
+        if args:
+            span.args = {**(span.args or {}), **args}
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "app", **args):
+        span = self.begin(name, cat, **args)
+        try:
+            yield span
+        finally:
+            self.end(span)
+
+    def spans(self, name: str | None = None, cat: str | None = None) -> list[Span]:
+        with self._lock:
+            spans = list(self._spans)
+        return [s for s in spans if (name is None or s.name == name) and (cat is None or s.cat == cat)]
+
+    def last(self, name: str) -> Span | None:
+        with self._lock:
+            for span in reversed(self._spans):
+                if span.name == name:
+                    return span
+        return None
+
+    def summary(self) -> dict[str, dict]:
+        """Per ogni nome di span: numero, durata totale e massima."""
+        stats: dict[str, dict] = {}
+        for span in self.spans():
+            entry = stats.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration
+            entry["max"] = max(entry["max"], span.duration)
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def dump(self, path: str, fmt: str = "chrome"):
+        """Scrive le span in ``path``: formato Chrome trace o JSON semplice."""
+        spans = self.spans()
+        if fmt == "chrome":
+            pid = os.getpid()
+            data = {"traceEvents": [
+                {"name": s.name, "cat": s.cat, "ph": "X", "pid": pid, "tid": s.thread,
+                 "ts": (s.start - self.origin) * 1e6, "dur": s.duration * 1e6,
+                 **({"args": s.args} if s.args else {})}
+                for s in spans
+            ], "displayTimeUnit": "ms"}
+        elif fmt == "json":
+            data = {"clock": "perf_counter", "spans": [s.to_dict(self.origin) for s in spans]}
+        else:
+            raise ValueError(f"Formato di trace sconosciuto: {fmt}")
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, ensure_ascii=False, default=str)
+
+
+def trace_target(path: str | None = None, fmt: str | None = None) -> tuple[str | None, str]:
+    """
+    File e formato di destinazione: argomenti espliciti, altrimenti variabili
+    d'ambiente. Un formato sconosciuto nella variabile d'ambiente diventa ``chrome``.
+    """
+    path = path or os.environ.get(TRACE_ENV) or None
+    fmt = fmt or os.environ.get(TRACE_FORMAT_ENV) or "chrome"
+    if fmt not in TRACE_FORMATS:
+        print(f"{TRACE_FORMAT_ENV}={fmt}: formato di trace sconosciuto, uso chrome "
+              f"(validi: {', '.join(TRACE_FORMATS)})", file=sys.stderr)
+        fmt = "chrome"
+    return path, fmt
+
+
+tracer = Tracer()
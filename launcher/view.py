@@ -0,0 +1,198 @@
+"""
+Vista incrementale del listbox: applica solo le righe inserite, rimosse o
+modificate invece di ricostruire l'intera lista a ogni cambiamento.
+
+Funziona con qualsiasi oggetto che esponga ``insert``/``delete``/``after``
+come ``tk.Listbox``; non importa tkinter.
+"""
+
+FILL_CHUNK = 500        # righe inserite per ogni passo del riempimento a blocchi
+
+TYPE_ICONS = {"folder": "📁", "url": "🌐"}
+
+# Segnalazioni del pre-flight mostrate in fondo alla riga
+STATUS_MARKS = {"missing": "    ⚠ non trovata", "slow": "    ⏳ non risponde"}
+
+
+def row_body(item, status: str | None = None) -> tuple[str, str]:
+    """Parte della riga che non dipende dalla posizione: (icona, testo)."""
+    icon = TYPE_ICONS.get(item.type, "📁")
+    return icon, f"{item.name}    —    {item.path}{STATUS_MARKS.get(status, '')}"
+
+
+def render_row(index: int, body: tuple[str, str]) -> str:
+    icon, text = body
+    return f"  {icon}  {index + 1}.  {text}"
+
+
+class ListboxView:
+    """Mantiene un listbox allineato a una lista di elementi."""
+
+    def __init__(self, listbox, chunk: int = FILL_CHUNK, status_of=None):
+        self.listbox = listbox
+        self.chunk = chunk
+        # status_of(item) -> esito del pre-flight da segnalare nella riga (o None)
+        self._status_of = status_of
+        # Corpo di ogni riga già calcolata, nello stesso ordine degli elementi
+        self._bodies: list[tuple[str, str]] = []
+        # Elementi di reset() ancora da mostrare: i loro corpi si calcolano un blocco alla volta
+        self._source: list | None = None
+        self._filled = 0            # righe effettivamente presenti nel listbox
+        self._fill_id = None
+        self._fill_done = None      # callback da chiamare a riempimento completato
+
+    def __len__(self):
+        return len(self._source) if self._source is not None else len(self._bodies)
+
+    @property
+    def filling(self) -> bool:
+        return self._fill_id is not None
+
+    # ── Full refresh ─────────────────────────────────────────────────────────
+
+    def reset(self, items, on_done=None):
+        """
+        Sostituisce tutte le righe. Il primo blocco viene mostrato subito,
+        i successivi vengono inseriti a blocchi dal ciclo degli eventi.
+        """
+        self._cancel_fill()
+        self._source = list(items)
+        self._bodies = []
+        self.listbox.delete(0, "end")
+        self._filled = 0
+        self._fill_done = on_done
+        self._fill_step()
+
+    def sync(self, items):
+        """Allinea la vista a ``items`` toccando solo il tratto che differisce."""
+        self.finish_fill()
+        new = [self._body(item) for item in items]
+        old = self._bodies
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        if start == len(old) == len(new):
+            return
+        if len(old) == len(new):
+            # Stessa lunghezza: la numerazione non cambia, basta sostituire il tratto modificato
+            end = len(old)
+            while end > start and old[end - 1] == new[end - 1]:
+                end -= 1
+            self._bodies = new
+            self._replace(start, end)
+        else:
+            self._bodies = new
+            self._rerender_from(start)
+
+    def clear(self):
+        self._cancel_fill()
+        self._bodies = []
+        self._source = None
+        self._filled = 0
+        self.listbox.delete(0, "end")
+
+    # ── Incremental edits ────────────────────────────────────────────────────
+
+    def insert(self, index: int, item):
+        self.finish_fill()
+        self._bodies.insert(index, self._body(item))
+        if index == len(self._bodies) - 1:
+            self.listbox.insert("end", render_row(index, self._bodies[index]))
+            self._filled += 1
+        else:
+            self._rerender_from(index)
+
+    def append(self, item):
+        self.insert(len(self._bodies), item)
+
+    def extend(self, items):
+        """Aggiunge più righe in coda con un'unica chiamata al listbox."""
+        self.finish_fill()
+        start = len(self._bodies)
+        self._bodies.extend(self._body(item) for item in items)
+        rows = [render_row(i, self._bodies[i]) for i in range(start, len(self._bodies))]
+        if rows:
+            self.listbox.insert("end", *rows)
+        self._filled = len(self._bodies)
+
+    def update(self, index: int, item):
+        self.finish_fill()
+        body = self._body(item)
+        if body != self._bodies[index]:
+            self._bodies[index] = body
+            self._replace(index, index + 1)
+
+    def remove(self, index: int):
+        self.finish_fill()
+        del self._bodies[index]
+        if index == len(self._bodies):
+            self.listbox.delete(index)
+            self._filled -= 1
+        else:
+            self._rerender_from(index)
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _body(self, item) -> tuple[str, str]:
+        return row_body(item, self._status_of(item) if self._status_of else None)
+
+    def _replace(self, start: int, end: int):
+        """Riscrive le righe [start, end) con un'unica delete e un'unica insert."""
+        rows = [render_row(i, self._bodies[i]) for i in range(start, end)]
+        top = self.listbox.yview()[0]
+        self.listbox.delete(start, end - 1)
+        self.listbox.insert(start, *rows)
+        self.listbox.yview_moveto(top)
+
+    def _rerender_from(self, start: int):
+        """
+        Dopo un inserimento o una rimozione la numerazione delle righe successive
+        cambia: vengono riscritte solo quelle, partendo da ``start``.
+        """
+        top = self.listbox.yview()[0]
+        self.listbox.delete(start, "end")
+        rows = [render_row(i, self._bodies[i]) for i in range(start, len(self._bodies))]
+        if rows:
+            self.listbox.insert(start, *rows)
+        self._filled = len(self._bodies)
+        self.listbox.yview_moveto(top)
+
+    def _fill_step(self):
+        self._fill_id = None
+        self._fill_to(min(self._filled + self.chunk, len(self)))
+        if self._filled < len(self):
+            self._fill_id = self.listbox.after(1, self._fill_step)
+        else:
+            self._fill_finished()
+
+    def _fill_to(self, end: int):
+        if self._source is not None:
+            self._bodies.extend(self._body(item) for item in self._source[len(self._bodies):end])
+            if end == len(self._source):
+                self._source = None
+        rows = [render_row(i, self._bodies[i]) for i in range(self._filled, end)]
+        if rows:
+            self.listbox.insert("end", *rows)
+        self._filled = end
+
+    def _fill_finished(self):
+        on_done, self._fill_done = self._fill_done, None
+        if on_done is not None:
+            on_done()
+
+    def finish_fill(self):
+        """Completa subito un eventuale riempimento a blocchi ancora in corso."""
+        if self._fill_id is None:
+            return
+        self.listbox.after_cancel(self._fill_id)
+        self._fill_id = None
+        self._fill_to(len(self))
+        self._fill_finished()
+
+    def _cancel_fill(self):
+        if self._fill_id is not None:
+            self.listbox.after_cancel(self._fill_id)
+            self._fill_id = None
+        self._fill_done = None
+        self._source = None
@@ -0,0 +1,97 @@
+"""
+Sorveglianza del config aperto: segnala quando il file cambia su disco.
+
+Usa un polling di ``os.stat`` in un thread dedicato, economico anche su
+cartelle di rete: l'intervallo parte da ``WATCH_INTERVAL`` e cresce fino a
+``WATCH_MAX_INTERVAL`` finché il file non cambia, poi torna al minimo.
+"""
+
+import collections
+import os
+import threading
+
+WATCH_INTERVAL = 0.5        # secondi tra due controlli subito dopo una modifica
+WATCH_MAX_INTERVAL = 5.0    # intervallo massimo quando il file resta fermo
+WATCH_BACKOFF = 1.5         # fattore di crescita dell'intervallo
+
+
+def file_signature(stat: os.stat_result | None):
+    """Identità di una versione del file; None se il file non esiste."""
+    if stat is None:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _stat(path: str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class FileWatcher:
+    """
+    Chiama ``on_change(path, stat)`` (dal thread di controllo) quando ``path``
+    cambia; ``stat`` è None se il file è stato rimosso.
+
+    Le versioni scritte dall'applicazione stessa vanno registrate con
+    ``acknowledge(stat)``: se il controllo successivo trova proprio quella
+    versione non viene segnalato nulla.
+    """
+
+    def __init__(self, path: str, on_change, interval: float = WATCH_INTERVAL,
+                 max_interval: float = WATCH_MAX_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.max_interval = max_interval
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._last = file_signature(_stat(path))
+        self._own: collections.deque = collections.deque(maxlen=8)
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="config-watch", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def check_now(self):
+        """Anticipa il prossimo controllo (es. quando la finestra torna in primo piano)."""
+        self._wake.set()
+
+    def acknowledge(self, stat: os.stat_result | None):
+        """Registra una versione del file prodotta da noi: non verrà segnalata."""
+        signature = file_signature(stat)
+        with self._lock:
+            self._own.append(signature)
+            self._last = signature
+
+    def is_own(self, stat: os.stat_result | None) -> bool:
+        with self._lock:
+            return file_signature(stat) in self._own
+
+    def _run(self):
+        delay = self.interval
+        while not self._stop.is_set():
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            stat = _stat(self.path)
+            signature = file_signature(stat)
+            with self._lock:
+                changed = signature != self._last
+                self._last = signature
+                own = signature in self._own
+            if not changed:
+                delay = min(delay * WATCH_BACKOFF, self.max_interval)
+                continue
+            delay = self.interval
+            if not own:
+                self._on_change(self.path, stat)
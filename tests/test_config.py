@@ -0,0 +1,21 @@
+import io
+import json
+import unittest
+
+from launcher.config import iter_config_items
+
+
+class StreamingParserTest(unittest.TestCase):
+
+    def test_number_split_across_chunks(self):
+        doc = '{"settings": 1.5e10, "x": -2.25E-3, "items": [{"path": "/a"}], "z": 1e+7}'
+        expected = {k: v for k, v in json.loads(doc).items() if k != "items"}
+        for chunk_size in range(1, 12):
+            meta = {}
+            items = list(iter_config_items(io.StringIO(doc), chunk_size=chunk_size, meta=meta))
+            self.assertEqual([item.path for item in items], ["/a"])
+            self.assertEqual(meta, expected, chunk_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
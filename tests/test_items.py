@@ -0,0 +1,38 @@
+import unittest
+
+from launcher.items import FOLDER, Item, ItemStore
+
+
+class ItemTest(unittest.TestCase):
+
+    def test_non_string_type_is_a_folder(self):
+        for value in (None, 1, ["url"]):
+            item = Item.from_dict({"path": "/x", "type": value})
+            self.assertIs(item.type, FOLDER)
+
+
+class ItemStoreTest(unittest.TestCase):
+
+    def test_splice_removes_every_duplicate_of_a_path(self):
+        store = ItemStore([Item("a", "/x"), Item("b", "/x"), Item("c", "/y")])
+        store.splice(0, 2, [])
+        self.assertEqual([item.name for item in store], ["c"])
+        self.assertFalse(store.has_path("/x"))
+        self.assertEqual(store.index_of("/y"), 0)
+        # L'indice resta coerente: il percorso si può aggiungere di nuovo senza duplicati fantasma
+        store.append(Item("d", "/x"))
+        self.assertEqual(store.index_of("/x"), 1)
+        store.pop(1)
+        self.assertFalse(store.has_path("/x"))
+
+    def test_splice_keeps_a_remaining_duplicate_indexed(self):
+        a, b, c = Item("a", "/x"), Item("b", "/x"), Item("c", "/x")
+        store = ItemStore([a, b, c])
+        store.splice(0, 2, [])
+        self.assertIs(store.find("/x"), c)
+        store.pop()
+        self.assertFalse(store.has_path("/x"))
+
+
+if __name__ == "__main__":
+    unittest.main()